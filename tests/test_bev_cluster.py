@@ -0,0 +1,127 @@
+"""
+Tests for the BEV cluster merger
+"""
+
+import numpy as np
+import pytest
+
+from trackstudio.mergers.bev_cluster import BEVClusterMerger, TrackCandidate
+from trackstudio.trackers.base import BEVTrack
+from trackstudio.vision_config import CrossCameraConfig
+
+
+def _pairwise_clusters(candidates: list[TrackCandidate], config: CrossCameraConfig) -> set[frozenset[int]]:
+    """Reference clustering: the original O(n^2) pairwise loop followed by a graph search"""
+    n = len(candidates)
+    adjacency: list[list[int]] = [[] for _ in range(n)]
+    for i in range(n):
+        for j in range(i + 1, n):
+            if candidates[i].camera_id == candidates[j].camera_id:
+                continue
+
+            spatial_dist = np.linalg.norm(np.array(candidates[i].position) - np.array(candidates[j].position))
+            if spatial_dist > config.spatial_threshold:
+                continue
+
+            feat_i = candidates[i].appearance_features
+            feat_j = candidates[j].appearance_features
+            if feat_i is not None and feat_j is not None:
+                cosine_sim = np.dot(feat_i, feat_j) / (np.linalg.norm(feat_i) * np.linalg.norm(feat_j) + 1e-8)
+                if 1.0 - cosine_sim > config.appearance_threshold:
+                    continue
+
+            adjacency[i].append(j)
+            adjacency[j].append(i)
+
+    clusters = set()
+    visited = [False] * n
+    for start in range(n):
+        if visited[start]:
+            continue
+        visited[start] = True
+        stack, cluster = [start], []
+        while stack:
+            u = stack.pop()
+            cluster.append(u)
+            for v in adjacency[u]:
+                if not visited[v]:
+                    visited[v] = True
+                    stack.append(v)
+        clusters.add(frozenset(cluster))
+    return clusters
+
+
+def _random_candidates(rng: np.random.Generator, n: int, feature_fraction: float) -> list[TrackCandidate]:
+    """Candidates spread over a few cameras, some with (unnormalized) appearance features"""
+    candidates = []
+    for index in range(n):
+        camera_id = int(rng.integers(0, 4))
+        track_id = f"{camera_id}_{index}"
+        x, y = rng.uniform(0, 300, size=2)
+        features = rng.normal(size=16) * rng.uniform(0.5, 5.0) if rng.random() < feature_fraction else None
+        candidates.append(
+            TrackCandidate(
+                camera_id=camera_id,
+                local_track_id=track_id,
+                position=(float(x), float(y)),
+                appearance_features=features,
+                original_bev_track=BEVTrack(track_id=track_id, bev_x=x, bev_y=y, confidence=1.0, camera_id=camera_id),
+                index=index,
+            )
+        )
+    return candidates
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("feature_fraction", [0.0, 0.5, 1.0])
+def test_clustering_matches_pairwise_reference(seed, feature_fraction):
+    rng = np.random.default_rng(seed)
+    config = CrossCameraConfig(spatial_threshold=20.0, appearance_threshold=0.9)
+    merger = BEVClusterMerger(config)
+    candidates = _random_candidates(rng, int(rng.integers(1, 120)), feature_fraction)
+
+    merger._stack_frame_features(candidates)
+    clusters = merger._cluster_tracks(candidates)
+
+    assert sum(len(cluster) for cluster in clusters) == len(candidates)
+    assert {frozenset(c.index for c in cluster) for cluster in clusters} == _pairwise_clusters(candidates, config)
+
+
+def test_clustering_without_candidates():
+    merger = BEVClusterMerger(CrossCameraConfig())
+    merger._stack_frame_features([])
+
+    assert merger._cluster_tracks([]) == []
+
+
+def test_merge_links_nearby_tracks_across_cameras():
+    merger = BEVClusterMerger(CrossCameraConfig(spatial_threshold=50.0))
+    tracks = [
+        BEVTrack(track_id="a", bev_x=100.0, bev_y=100.0, confidence=0.9, camera_id=0),
+        BEVTrack(track_id="b", bev_x=110.0, bev_y=105.0, confidence=0.9, camera_id=1),
+        BEVTrack(track_id="c", bev_x=300.0, bev_y=300.0, confidence=0.9, camera_id=0),
+        # Close to "c" but on the same camera, so never merged with it
+        BEVTrack(track_id="d", bev_x=305.0, bev_y=300.0, confidence=0.9, camera_id=0),
+    ]
+
+    merged = {track.track_id: track.global_id for track in merger.merge(tracks, timestamp=0.0)}
+
+    assert merged["a"] == merged["b"]
+    assert len({merged["a"], merged["c"], merged["d"]}) == 3
+    assert merger.total_tracks_created == 3
+
+
+def test_merge_rejects_dissimilar_appearance():
+    merger = BEVClusterMerger(CrossCameraConfig(spatial_threshold=50.0, appearance_threshold=0.3))
+    tracks = [
+        BEVTrack(track_id="a", bev_x=100.0, bev_y=100.0, confidence=0.9, camera_id=0),
+        BEVTrack(track_id="b", bev_x=105.0, bev_y=100.0, confidence=0.9, camera_id=1),
+    ]
+    orthogonal = {"a": np.array([1.0, 0.0]), "b": np.array([0.0, 3.0])}
+    aligned = {"a": np.array([1.0, 0.0]), "b": np.array([4.0, 0.1])}
+
+    merged = merger.merge(tracks, timestamp=0.0, reid_features=orthogonal)
+    assert merged[0].global_id != merged[1].global_id
+
+    merged = BEVClusterMerger(merger.config).merge(tracks, timestamp=0.0, reid_features=aligned)
+    assert merged[0].global_id == merged[1].global_id
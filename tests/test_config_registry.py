@@ -0,0 +1,126 @@
+"""
+Tests for cache invalidation in the config registry and the dynamic config system
+"""
+
+import pytest
+from pydantic import BaseModel
+
+from trackstudio import config_registry
+from trackstudio.config_registry import (
+    get_merger_names,
+    get_registered_merger_configs,
+    get_registered_tracker_configs,
+    get_tracker_config_version,
+    get_tracker_names,
+    register_merger_config,
+    register_tracker_config,
+)
+from trackstudio.trackers.base import BaseTrackerConfig
+from trackstudio.vision_config import VisionSystemConfig, get_vision_system_config, refresh_config_system
+
+
+@pytest.fixture
+def restore_registries():
+    """Undo test registrations so the global registries are unchanged for other tests"""
+    tracker_configs = dict(config_registry._TRACKER_CONFIGS)
+    merger_configs = dict(config_registry._MERGER_CONFIGS)
+
+    yield
+
+    config_registry._TRACKER_CONFIGS.clear()
+    config_registry._TRACKER_CONFIGS.update(tracker_configs)
+    config_registry._MERGER_CONFIGS.clear()
+    config_registry._MERGER_CONFIGS.update(merger_configs)
+    config_registry._clear_tracker_caches()
+    config_registry._clear_merger_caches()
+    refresh_config_system()
+
+
+class _TestTrackerConfig(BaseTrackerConfig):
+    """Tracker config registered by the tests"""
+
+    threshold: float = 0.5
+
+
+class _TestMergerConfig(BaseModel):
+    """Merger config registered by the tests"""
+
+    distance: float = 1.0
+
+
+def test_tracker_lookups_are_cached():
+    assert get_tracker_names() is get_tracker_names()
+    assert get_registered_tracker_configs() is get_registered_tracker_configs()
+
+
+@pytest.mark.usefixtures("restore_registries")
+def test_registering_tracker_config_invalidates_caches():
+    names = get_tracker_names()
+    configs = get_registered_tracker_configs()
+    version = get_tracker_config_version()
+
+    register_tracker_config("test_tracker")(_TestTrackerConfig)
+
+    assert get_tracker_config_version() == version + 1
+    assert "test_tracker" not in names
+    assert "test_tracker" in get_tracker_names()
+    assert "test_tracker" not in configs
+    assert get_registered_tracker_configs()["test_tracker"] is _TestTrackerConfig
+
+
+@pytest.mark.usefixtures("restore_registries")
+def test_registering_merger_config_invalidates_caches():
+    names = get_merger_names()
+    configs = get_registered_merger_configs()
+
+    register_merger_config("test_merger")(_TestMergerConfig)
+
+    assert "test_merger" not in names
+    assert "test_merger" in get_merger_names()
+    assert "test_merger" not in configs
+    assert get_registered_merger_configs()["test_merger"] is _TestMergerConfig
+
+
+def test_register_rejects_wrong_base_classes():
+    with pytest.raises(ValueError, match="must inherit from BaseTrackerConfig"):
+        register_tracker_config("bad")(_TestMergerConfig)
+    with pytest.raises(ValueError, match="must inherit from BaseModel"):
+        register_merger_config("bad")(object)
+
+
+def test_config_class_is_cached_until_refresh():
+    config_class = get_vision_system_config()
+    assert get_vision_system_config() is config_class
+
+    refresh_config_system()
+
+    assert get_vision_system_config() is not config_class
+
+
+def test_schema_is_cached_until_refresh():
+    schema = VisionSystemConfig.model_json_schema()
+    assert VisionSystemConfig.model_json_schema() is schema
+
+    refresh_config_system()
+
+    refreshed = VisionSystemConfig.model_json_schema()
+    assert refreshed is not schema
+    assert refreshed == schema
+
+
+@pytest.mark.usefixtures("restore_registries")
+def test_registration_refreshes_config_system():
+    config_class = get_vision_system_config()
+    assert "test_tracker_tracker" not in config_class.model_fields
+
+    register_tracker_config("test_tracker")(_TestTrackerConfig)
+    register_merger_config("test_merger")(_TestMergerConfig)
+
+    refreshed = get_vision_system_config()
+    assert refreshed is not config_class
+    assert {"test_tracker_tracker", "test_merger_merger"} <= set(refreshed.model_fields)
+    assert "test_tracker_tracker" in VisionSystemConfig.model_json_schema()["properties"]
+
+    config = VisionSystemConfig(tracker_type="test_tracker", merger_type="test_merger")
+    assert isinstance(config.get_tracker_config(), _TestTrackerConfig)
+    assert isinstance(config.get_merger_config(), _TestMergerConfig)
@@ -0,0 +1,120 @@
+"""
+Tests for the Kalman filter and smoothing utilities
+"""
+
+import numpy as np
+import pytest
+
+from trackstudio.utils.filters import BatchedKalmanFilter, SimpleKalmanFilter
+
+# Measurement matrix of the constant velocity model (only the position is observed)
+H = np.array([[1.0, 0.0, 0.0, 0.0], [0.0, 1.0, 0.0, 0.0]])
+
+
+def _transition(dt: float) -> np.ndarray:
+    """Constant velocity state transition matrix for a time step"""
+    transition = np.eye(4)
+    transition[0, 2] = dt
+    transition[1, 3] = dt
+    return transition
+
+
+def _random_covariance(rng: np.random.Generator) -> np.ndarray:
+    """Random symmetric positive definite 4x4 covariance"""
+    a = rng.normal(size=(4, 4))
+    return a @ a.T + np.eye(4)
+
+
+@pytest.mark.parametrize("dt", [1.0, 0.5, 2.3])
+def test_predict_matches_matrix_form(dt):
+    rng = np.random.default_rng(0)
+    kf = SimpleKalmanFilter((3.0, -2.0))
+    kf.state = rng.normal(size=4)
+    kf.P = _random_covariance(rng)
+
+    transition = _transition(dt)
+    expected_state = transition @ kf.state
+    expected_cov = transition @ kf.P @ transition.T + kf.Q
+
+    predicted = kf.predict(dt)
+
+    np.testing.assert_allclose(kf.state, expected_state, rtol=0, atol=1e-12)
+    np.testing.assert_allclose(kf.P, expected_cov, rtol=0, atol=1e-12)
+    assert predicted == pytest.approx(tuple(expected_state[:2]))
+
+
+def test_predict_and_update_match_matrix_form():
+    rng = np.random.default_rng(1)
+    kf = SimpleKalmanFilter((0.0, 0.0))
+    state = kf.state.copy()
+    cov = kf.P.copy()
+
+    for step in range(50):
+        dt = 0.5 + step % 3 * 0.25
+        transition = _transition(dt)
+        state = transition @ state
+        cov = transition @ cov @ transition.T + kf.Q
+        kf.predict(dt)
+
+        measurement = rng.normal(size=2) * 5 + step
+        gain = cov @ H.T @ np.linalg.inv(H @ cov @ H.T + kf.R)
+        state = state + gain @ (measurement - H @ state)
+        cov = (np.eye(4) - gain @ H) @ cov
+        updated = kf.update(tuple(measurement))
+
+        np.testing.assert_allclose(kf.state, state, rtol=1e-12, atol=1e-9)
+        np.testing.assert_allclose(kf.P, cov, rtol=1e-12, atol=1e-9)
+        assert updated == pytest.approx(tuple(state[:2]))
+
+
+def test_batched_filter_matches_independent_filters():
+    rng = np.random.default_rng(2)
+    batch = BatchedKalmanFilter(process_noise=0.5, measurement_noise=4.0)
+    filters = []
+    for pos in rng.uniform(0, 100, size=(50, 2)):
+        batch.add(tuple(pos))
+        filters.append(SimpleKalmanFilter(tuple(pos), process_noise=0.5, measurement_noise=4.0))
+
+    for step in range(100):
+        # Drop a track from the middle of the batch and add a new one at the end
+        if step in {20, 55}:
+            index = len(filters) // 2
+            batch.remove(index)
+            del filters[index]
+        if step in {30, 70}:
+            pos = tuple(rng.uniform(0, 100, size=2))
+            assert batch.add(pos) == len(filters)
+            filters.append(SimpleKalmanFilter(pos, process_noise=0.5, measurement_noise=4.0))
+
+        dt = 0.5 + step % 4 * 0.25
+        predicted = batch.predict(dt)
+        expected = np.array([kf.predict(dt) for kf in filters])
+        np.testing.assert_allclose(predicted, expected, rtol=0, atol=1e-12)
+
+        # Only some tracks are measured each step
+        measurements = expected + rng.normal(size=expected.shape)
+        mask = rng.random(len(filters)) < 0.6
+        updated = batch.update(measurements, mask)
+        for kf, measurement, measured in zip(filters, measurements, mask, strict=True):
+            if measured:
+                kf.update(tuple(measurement))
+
+        assert len(batch) == len(filters)
+        np.testing.assert_allclose(updated, [kf.get_position() for kf in filters], rtol=0, atol=1e-12)
+        np.testing.assert_allclose(batch.state, [kf.state for kf in filters], rtol=0, atol=1e-12)
+        np.testing.assert_allclose(batch.P, [kf.P for kf in filters], rtol=0, atol=1e-12)
+
+
+def test_batched_update_without_measurements_keeps_state():
+    batch = BatchedKalmanFilter()
+    batch.add((1.0, 2.0))
+    batch.add((3.0, 4.0))
+    batch.predict()
+    state = batch.state.copy()
+    cov = batch.P.copy()
+
+    updated = batch.update(np.zeros((2, 2)), np.zeros(2, dtype=bool))
+
+    np.testing.assert_array_equal(updated, state[:, :2])
+    np.testing.assert_array_equal(batch.state, state)
+    np.testing.assert_array_equal(batch.P, cov)
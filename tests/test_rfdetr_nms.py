@@ -0,0 +1,80 @@
+"""
+Tests for the RF-DETR tracker's detection NMS
+"""
+
+import numpy as np
+import pytest
+
+# The RF-DETR tracker module needs the torch stack; skip where it is not installed
+pytest.importorskip("torchvision")
+pytest.importorskip("supervision")
+
+from trackstudio.trackers.base import Detection
+from trackstudio.trackers.rfdetr import RFDETRTracker
+
+
+def _greedy_nms(detections: list[Detection], iou_threshold: float) -> list[int]:
+    """Reference NMS: keep the highest scoring box, drop boxes overlapping it by more than the threshold"""
+    boxes = np.array([d.bbox for d in detections], dtype=np.float64)
+    x1, y1 = boxes[:, 0], boxes[:, 1]
+    x2, y2 = x1 + boxes[:, 2], y1 + boxes[:, 3]
+    areas = boxes[:, 2] * boxes[:, 3]
+
+    order = sorted(range(len(detections)), key=lambda i: -detections[i].confidence)
+    keep: list[int] = []
+    for i in order:
+        suppressed = False
+        for k in keep:
+            w = max(0.0, min(x2[i], x2[k]) - max(x1[i], x1[k]))
+            h = max(0.0, min(y2[i], y2[k]) - max(y1[i], y1[k]))
+            inter = w * h
+            if inter / (areas[i] + areas[k] - inter) > iou_threshold:
+                suppressed = True
+                break
+        if not suppressed:
+            keep.append(i)
+    return keep
+
+
+def _random_detections(rng: np.random.Generator, n: int) -> list[Detection]:
+    """Person detections clustered around a few centers so many of them overlap"""
+    centers = rng.uniform(50, 500, size=(4, 2))
+    detections = []
+    for _ in range(n):
+        cx, cy = centers[rng.integers(0, len(centers))] + rng.normal(scale=15, size=2)
+        w, h = rng.integers(30, 90, size=2)
+        detections.append(
+            Detection(
+                bbox=(int(cx - w / 2), int(cy - h / 2), int(w), int(h)),
+                confidence=float(rng.uniform(0.3, 1.0)),
+                class_name="person",
+                class_id=0,
+            )
+        )
+    return detections
+
+
+@pytest.fixture
+def tracker():
+    # _apply_nms needs no model state, so skip loading RF-DETR and ReID
+    return RFDETRTracker.__new__(RFDETRTracker)
+
+
+@pytest.mark.parametrize("seed", range(5))
+@pytest.mark.parametrize("iou_threshold", [0.3, 0.5, 0.7])
+def test_nms_matches_greedy_reference(tracker, seed, iou_threshold):
+    detections = _random_detections(np.random.default_rng(seed), 40)
+
+    kept = tracker._apply_nms(detections, iou_threshold)
+
+    assert kept == [detections[i] for i in _greedy_nms(detections, iou_threshold)]
+    assert len(kept) < len(detections)
+
+
+def test_nms_keeps_disjoint_boxes_by_confidence(tracker):
+    detections = [
+        Detection(bbox=(0, 0, 10, 10), confidence=0.5, class_name="person", class_id=0),
+        Detection(bbox=(100, 100, 10, 10), confidence=0.9, class_name="person", class_id=0),
+    ]
+
+    assert tracker._apply_nms(detections, 0.5) == [detections[1], detections[0]]
@@ -0,0 +1,154 @@
+"""
+Tests for the tracker registry and the tracker factory lookups built on it
+"""
+
+import sys
+
+import pytest
+
+from trackstudio import tracker_factory
+from trackstudio.config_registry import _TRACKER_CONFIGS, _clear_tracker_caches, register_tracker_config
+from trackstudio.trackers import TrackerRegistry, tracker_registry
+from trackstudio.trackers.base import BaseTrackerConfig
+from trackstudio.trackers.dummy import DummyVisionTracker
+from trackstudio.vision_config import refresh_config_system
+
+
+class _LazyTracker(DummyVisionTracker):
+    """Tracker returned by the counting loader below"""
+
+
+@pytest.fixture
+def registry():
+    return TrackerRegistry()
+
+
+@pytest.fixture
+def counting_loader():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return _LazyTracker
+
+    loader.calls = calls
+    return loader
+
+
+@pytest.fixture
+def temporary_tracker_config():
+    """Register a throwaway tracker config and remove it again afterwards"""
+    registered = []
+
+    def register(name: str) -> type[BaseTrackerConfig]:
+        config_class = type(f"{name.title()}Config", (BaseTrackerConfig,), {})
+        registered.append(name)
+        return register_tracker_config(name)(config_class)
+
+    yield register
+
+    for name in registered:
+        _TRACKER_CONFIGS.pop(name, None)
+    _clear_tracker_caches()
+    refresh_config_system()
+
+
+def test_rfdetr_is_registered_lazily():
+    assert "rfdetr" in tracker_registry.list_available()
+    assert not isinstance(tracker_registry._trackers["rfdetr"], type)
+
+
+def test_lazy_registration_resolves_once(registry, counting_loader):
+    registry.register_lazy("lazy", counting_loader, class_name="_LazyTracker", module=__name__)
+    assert counting_loader.calls == []
+
+    assert registry.get("lazy") is _LazyTracker
+    assert registry.get("lazy") is _LazyTracker
+    assert len(counting_loader.calls) == 1
+
+
+def test_describe_does_not_resolve_lazy_registration(registry, counting_loader):
+    registry.register_lazy("lazy", counting_loader, class_name="_LazyTracker", module=__name__, docstring="Lazy.")
+
+    assert registry.describe("lazy") == {"class_name": "_LazyTracker", "module": __name__, "docstring": "Lazy."}
+    assert counting_loader.calls == []
+
+    registry.get("lazy")
+    assert registry.describe("lazy")["class_name"] == "_LazyTracker"
+
+
+def test_describe_unknown_tracker_raises(registry):
+    with pytest.raises(ValueError, match="Unknown tracker"):
+        registry.describe("missing")
+
+
+def test_version_bumps_on_every_change(registry, counting_loader):
+    version = registry.version
+
+    registry.register("custom", _LazyTracker)
+    assert registry.version == version + 1
+
+    registry.register_lazy("lazy", counting_loader, class_name="_LazyTracker", module=__name__)
+    assert registry.version == version + 2
+
+    assert registry.unregister("custom")
+    assert registry.version == version + 3
+
+    # Unknown names and resolving a lazy registration leave the version alone
+    assert not registry.unregister("custom")
+    registry.get("lazy")
+    assert registry.version == version + 3
+
+
+def test_register_rejects_non_tracker_classes(registry):
+    with pytest.raises(TypeError):
+        registry.register("bad", object)
+
+
+def test_module_getattr_for_unknown_names():
+    import trackstudio.trackers as trackers_module  # noqa: PLC0415
+
+    with pytest.raises(AttributeError):
+        _ = trackers_module.DoesNotExist
+
+
+def test_get_tracker_info_does_not_import_rfdetr():
+    was_imported = "trackstudio.trackers.rfdetr" in sys.modules
+
+    info = tracker_factory.get_tracker_info("rfdetr")
+
+    assert info["class_name"] == "RFDETRTracker"
+    assert info["module"] == "trackstudio.trackers.rfdetr"
+    assert ("trackstudio.trackers.rfdetr" in sys.modules) == was_imported
+
+
+def test_get_tracker_info_for_registered_class():
+    info = tracker_factory.get_tracker_info("dummy")
+
+    assert info["class_name"] == "DummyVisionTracker"
+    assert info["registered"] is True
+
+    # Callers get a copy, not the cached entry
+    info["class_name"] = "changed"
+    assert tracker_factory.get_tracker_info("dummy")["class_name"] == "DummyVisionTracker"
+
+
+def test_available_trackers_follow_registry_changes(temporary_tracker_config):
+    available = tracker_factory.get_available_trackers()
+    assert tracker_factory.get_available_trackers() is available
+    assert "test_lazy_registry" not in available
+
+    temporary_tracker_config("test_lazy_registry")
+
+    assert "test_lazy_registry" in tracker_factory.get_available_trackers()
+
+
+def test_tracker_type_from_env_is_not_cached(monkeypatch, temporary_tracker_config):
+    monkeypatch.setenv("VISION_TRACKER_TYPE", "dummy")
+    assert tracker_factory.get_tracker_type_from_env() == "dummy"
+
+    # A tracker registered after the first lookup is picked up
+    monkeypatch.setenv("VISION_TRACKER_TYPE", "test_env_tracker")
+    assert tracker_factory.get_tracker_type_from_env() == "rfdetr"
+    temporary_tracker_config("test_env_tracker")
+    assert tracker_factory.get_tracker_type_from_env() == "test_env_tracker"
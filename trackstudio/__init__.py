@@ -153,6 +153,9 @@ def register_tracker(name: str, tracker_class: type):
         name: Name for the tracker
         tracker_class: Tracker class (must inherit from VisionTracker)
 
+    Raises:
+        TypeError: If the tracker class doesn't inherit from VisionTracker
+
     Example:
         >>> from trackstudio import VisionTracker, register_tracker
         >>>
@@ -7,6 +7,7 @@ making it much easier to add new trackers without modifying multiple files.
 
 import logging
 from collections.abc import Callable
+from functools import lru_cache
 from typing import cast
 
 from pydantic import BaseModel, Field, create_model
@@ -19,6 +20,9 @@ logger = logging.getLogger(__name__)
 _TRACKER_CONFIGS: dict[str, type[BaseTrackerConfig]] = {}
 _MERGER_CONFIGS: dict[str, type[BaseModel]] = {}
 
+# Bumped on every tracker config registration so dependent caches can key on it
+_tracker_config_version = 0
+
 
 def register_tracker_config(name: str) -> Callable[[type[BaseTrackerConfig]], type[BaseTrackerConfig]]:
     """
@@ -53,6 +57,7 @@ def register_tracker_config(name: str) -> Callable[[type[BaseTrackerConfig]], ty
             raise ValueError(f"Config class {config_class.__name__} must inherit from BaseTrackerConfig")
 
         _TRACKER_CONFIGS[name] = config_class
+        _clear_tracker_caches()
         logger.debug(f"📝 Registered tracker config: {name} -> {config_class.__name__}")
 
         # Only refresh if the config system is already initialized
@@ -102,6 +107,7 @@ def register_merger_config(name: str) -> Callable[[type[BaseModel]], type[BaseMo
             raise ValueError(f"Config class {config_class.__name__} must inherit from BaseModel")
 
         _MERGER_CONFIGS[name] = config_class
+        _clear_merger_caches()
         logger.debug(f"📝 Registered merger config: {name} -> {config_class.__name__}")
 
         # Only refresh if the config system is already initialized
@@ -118,46 +124,86 @@ def register_merger_config(name: str) -> Callable[[type[BaseModel]], type[BaseMo
     return decorator
 
 
+@lru_cache(maxsize=1)
 def get_registered_tracker_configs() -> dict[str, type[BaseTrackerConfig]]:
     """
     Get all registered tracker configurations.
 
+    The result is cached until a new tracker config is registered, so callers
+    must treat it as read-only.
+
     Returns:
         Dictionary mapping tracker names to their configuration classes
     """
     return _TRACKER_CONFIGS.copy()
 
 
+@lru_cache(maxsize=1)
 def get_registered_merger_configs() -> dict[str, type[BaseModel]]:
     """
     Get all registered merger configurations.
 
+    The result is cached until a new merger config is registered, so callers
+    must treat it as read-only.
+
     Returns:
         Dictionary mapping merger names to their configuration classes
     """
     return _MERGER_CONFIGS.copy()
 
 
+@lru_cache(maxsize=1)
 def get_tracker_names() -> list[str]:
     """
     Get list of all registered tracker names.
 
+    The result is cached until a new tracker config is registered, so callers
+    must treat it as read-only.
+
     Returns:
         List of registered tracker names
     """
     return list(_TRACKER_CONFIGS.keys())
 
 
+@lru_cache(maxsize=1)
 def get_merger_names() -> list[str]:
     """
     Get list of all registered merger names.
 
+    The result is cached until a new merger config is registered, so callers
+    must treat it as read-only.
+
     Returns:
         List of registered merger names
     """
     return list(_MERGER_CONFIGS.keys())
 
 
+def get_tracker_config_version() -> int:
+    """
+    Get the tracker config registry version.
+
+    Returns:
+        Counter that increases every time a tracker config is registered
+    """
+    return _tracker_config_version
+
+
+def _clear_tracker_caches() -> None:
+    """Invalidate cached tracker registry lookups after the registry changes."""
+    global _tracker_config_version  # noqa: PLW0603
+    _tracker_config_version += 1
+    get_registered_tracker_configs.cache_clear()
+    get_tracker_names.cache_clear()
+
+
+def _clear_merger_caches() -> None:
+    """Invalidate cached merger registry lookups after the registry changes."""
+    get_registered_merger_configs.cache_clear()
+    get_merger_names.cache_clear()
+
+
 def create_vision_system_config() -> tuple[type[BaseModel], str, str]:
     """
     Dynamically create VisionSystemConfig with all registered tracker and merger configs.
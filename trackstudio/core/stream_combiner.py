@@ -38,9 +38,12 @@ class StreamFrame:
 class StreamCombinerTrack(VideoStreamTrack):
     """VideoTrack that captures individual RTMP/RTSP streams and combines them with manual delays"""
 
-    def __init__(self):
+    def __init__(self, new_result_event: asyncio.Event | None = None):
         super().__init__()
 
+        # Signalled whenever a new vision result is published
+        self.new_result_event = new_result_event
+
         # Individual stream captures
         self.stream_caps = {}  # {stream_id: cv2.VideoCapture}
         self.is_running = False
@@ -523,6 +526,8 @@ class StreamCombinerTrack(VideoStreamTrack):
                         # Simple timestamp - just what we need
                         result.timestamp = timestamp
                         self.latest_vision_result = result
+                        if self.new_result_event is not None:
+                            self.new_result_event.set()
 
                 else:
                     logger.warning(f"⚠️ Vision processing returned None for frame {frame_id}")
@@ -673,6 +678,8 @@ class StreamCombinerManager:
     def __init__(self):
         self.track: StreamCombinerTrack | None = None
         self.is_running = False
+        # Set by the track each time a new vision result is available
+        self.new_result_event = asyncio.Event()
 
     @property
     def vision_api(self):
@@ -690,7 +697,7 @@ class StreamCombinerManager:
 
             # Get or create track (track is created immediately in get_video_track now)
             if not self.track:
-                self.track = StreamCombinerTrack()
+                self.track = StreamCombinerTrack(self.new_result_event)
 
             # Start initialization in background
             asyncio.create_task(self._background_start())
@@ -739,7 +746,7 @@ class StreamCombinerManager:
         """Get the video track for WebRTC - always returns a track (black frames if not ready)"""
         if not self.track:
             # Create track immediately, even if streams aren't ready
-            self.track = StreamCombinerTrack()
+            self.track = StreamCombinerTrack(self.new_result_event)
             logger.info("🎬 Created video track (will show black frames until streams are ready)")
         return self.track
 
@@ -176,25 +176,18 @@ class VisionAPI:
 
             # ⏱️ STEP 3: Detection and Tracking per Stream
             step3_start = time.time()
-            # Process each stream separately for detection
-            all_detections = {}
-            all_tracks = {}
-
-            detection_times = {}
-            tracking_times = {}
-
-            for stream_id, frame in stream_frames.items():
-                # ⏱️ Detection timing
-                detection_start = time.time()
-                detections = self.tracker.detect(frame, camera_id=stream_id)
-                detection_times[stream_id] = (time.time() - detection_start) * 1000
-                all_detections[stream_id] = detections
-
-                # ⏱️ Tracking timing
-                tracking_start = time.time()
-                tracks = self.tracker.track(detections, camera_id=stream_id, timestamp=timestamp, frame=frame)
-                tracking_times[stream_id] = (time.time() - tracking_start) * 1000
-                all_tracks[stream_id] = tracks
+            # Detect and track on all streams at once so trackers can batch or parallelize per-camera work
+            # ⏱️ Detection timing (a batched pass is attributed evenly across streams)
+            detection_start = time.time()
+            all_detections = self.tracker.detect_batch(stream_frames)
+            detection_time_per_stream = (time.time() - detection_start) * 1000 / max(len(stream_frames), 1)
+            detection_times = dict.fromkeys(stream_frames, detection_time_per_stream)
+
+            # ⏱️ Tracking timing (attributed evenly across streams, which may be tracked concurrently)
+            tracking_start = time.time()
+            all_tracks = self.tracker.track_batch(all_detections, stream_frames, timestamp=timestamp)
+            tracking_time_per_stream = (time.time() - tracking_start) * 1000 / max(len(stream_frames), 1)
+            tracking_times = dict.fromkeys(stream_frames, tracking_time_per_stream)
 
             step3_time = (time.time() - step3_start) * 1000
 
@@ -214,20 +207,14 @@ class VisionAPI:
 
             # ⏱️ STEP 5: ReID Feature Extraction
             step5_start = time.time()
-            # Extract ReID features if tracker supports it
+            # Extract ReID features for all active streams at once (None where unsupported)
             reid_features = {}
-            if hasattr(self.tracker, "get_reid_features"):
-                # Extract features for each active stream
-                for stream_id, stream_frame in stream_frames.items():
-                    if stream_id in all_tracks:
-                        stream_tracks = all_tracks[stream_id]
-
-                        features = self.tracker.get_reid_features(stream_frame, stream_tracks)
-
-                        # Store features by track ID
-                        if features is not None:
-                            for track, feature in zip(stream_tracks, features, strict=False):
-                                reid_features[track.track_id] = feature
+            features_by_stream = self.tracker.get_reid_features_multi(stream_frames, all_tracks)
+            for stream_id, features in features_by_stream.items():
+                # Store features by track ID
+                if features is not None:
+                    for track, feature in zip(all_tracks[stream_id], features, strict=False):
+                        reid_features[track.track_id] = feature
             step5_time = (time.time() - step5_start) * 1000
 
             # ⏱️ STEP 6: Cross-Camera Merging
@@ -424,7 +411,9 @@ class VisionAPI:
     def get_config_schema(self) -> dict[str, Any] | None:
         """Get the JSON schema for the current vision system's configuration"""
         if self.config:
-            schema = self.config.model_json_schema()
+            # The class-level schema is cached and shared; only top-level keys are replaced below
+            # and resolve_refs() builds new nested dicts, so a shallow copy keeps the cache intact
+            schema = dict(VisionSystemConfig.model_json_schema())
 
             # Filter schema to only show currently active tracker/merger configs
             if "properties" in schema:
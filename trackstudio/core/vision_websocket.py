@@ -18,6 +18,9 @@ from .stream_combiner import stream_combiner_manager
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Maximum number of clients sent to concurrently during a broadcast
+BROADCAST_BATCH_SIZE = 50
+
 
 def make_json_serializable(obj: Any) -> Any:
     """Convert numpy types and other non-JSON-serializable types to Python native types"""
@@ -34,18 +37,59 @@ def make_json_serializable(obj: Any) -> Any:
     return obj
 
 
+def _as_float_list(values: Any) -> list[float]:
+    """Convert a bbox (numpy array or sequence of numbers) to a list of Python floats"""
+    if isinstance(values, np.ndarray):
+        return values.astype(float, copy=False).tolist()
+    return list(map(float, values))
+
+
+def _serialize_detection(index: int, det: Any) -> dict[str, Any]:
+    """Convert a Detection to its JSON metadata representation"""
+    x, y, w, h = bbox = _as_float_list(det.bbox)
+    return {
+        "id": index,
+        "bbox": bbox,
+        "confidence": float(det.confidence),
+        "class_name": str(det.class_name),
+        "class_id": int(det.class_id),
+        "bottom_center": [x + w / 2, y + h],
+    }
+
+
+def _serialize_track(track: Any) -> dict[str, Any]:
+    """Convert a Track to its JSON metadata representation"""
+    x, y, w, h = bbox = _as_float_list(track.bbox)
+    return {
+        "id": str(track.track_id),
+        "bbox": bbox,
+        "confidence": float(track.confidence),
+        "class_name": "person",  # Default for now
+        "center": [(x + w) / 2, (y + h) / 2],
+    }
+
+
+def _trajectory_to_list(trajectory: Any) -> list[list[float]]:
+    """Convert a trajectory of (x, y, timestamp) points to nested float lists in one numpy pass"""
+    if trajectory is None or len(trajectory) == 0:
+        return []
+    return np.asarray(trajectory, dtype=np.float64).tolist()
+
+
 class VisionWebSocketManager:
     """Manages WebSocket connections for vision metadata"""
 
     def __init__(self):
-        self.active_connections: set[WebSocket] = set()
+        self.active_connections: list[WebSocket] = []
         self.transmission_task = None
         self.is_running = False
+        self._last_status_time: float | None = None
+        self._status_template: dict[str, Any] | None = None
 
     async def connect(self, websocket: WebSocket):
         """Accept a new WebSocket connection"""
         await websocket.accept()
-        self.active_connections.add(websocket)
+        self.active_connections.append(websocket)
         logger.info(f"Vision WebSocket connected. Total connections: {len(self.active_connections)}")
 
         # Start transmission task if this is the first connection
@@ -54,7 +98,8 @@ class VisionWebSocketManager:
 
     def disconnect(self, websocket: WebSocket):
         """Remove a WebSocket connection"""
-        self.active_connections.discard(websocket)
+        if websocket in self.active_connections:
+            self.active_connections.remove(websocket)
         logger.info(f"Vision WebSocket disconnected. Total connections: {len(self.active_connections)}")
 
         # Stop transmission task if no more connections
@@ -80,12 +125,19 @@ class VisionWebSocketManager:
         logger.info("Stopped vision metadata transmission")
 
     async def _transmission_loop(self):
-        """High-frequency vision metadata transmission - only send when data changes"""
+        """Event-driven vision metadata transmission - only send when data changes"""
         last_sent_frame_id = None
+        new_result_event = stream_combiner_manager.new_result_event
 
         try:
             while self.is_running and self.active_connections:
                 try:
+                    # Wake up as soon as a new vision result is published; the timeout keeps
+                    # periodic status messages flowing while no frames are being processed
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(new_result_event.wait(), timeout=5.0)
+                    new_result_event.clear()
+
                     # Get latest vision results
                     vision_result = stream_combiner_manager.get_latest_vision_result()
                     vision_tracking_enabled = stream_combiner_manager.is_vision_tracking_enabled()
@@ -105,21 +157,13 @@ class VisionWebSocketManager:
                     # Send periodic status even if no vision data (every 5 seconds)
                     elif (
                         vision_tracking_enabled
-                        and hasattr(self, "_last_status_time")
+                        and self._last_status_time is not None
                         and (time.time() - self._last_status_time) > 5.0
                     ):
                         should_send_data = True
                         self._last_status_time = time.time()
-
-                        # Create status message
-                        metadata = {
-                            "type": "vision_status",
-                            "timestamp": time.time(),
-                            "tracking_enabled": True,
-                            "active_stream_ids": [stream["id"] for stream in ServerConfig.get_enabled_streams()],
-                            "message": "Vision tracking active, waiting for video frames...",
-                        }
-                    elif not hasattr(self, "_last_status_time"):
+                        metadata = self._get_status_message(self._last_status_time)
+                    elif self._last_status_time is None:
                         self._last_status_time = time.time()
 
                     if should_send_data and vision_result is not None:
@@ -144,55 +188,37 @@ class VisionWebSocketManager:
                             "all_streams": {
                                 str(stream_id): {
                                     "detections": [
-                                        {
-                                            "id": i,
-                                            "bbox": [float(x) for x in det.bbox],
-                                            "confidence": float(det.confidence),
-                                            "class_name": str(det.class_name),
-                                            "class_id": int(det.class_id),
-                                            "bottom_center": [
-                                                float(det.bbox[0] + det.bbox[2] / 2),
-                                                float(det.bbox[1] + det.bbox[3]),
-                                            ],
-                                        }
+                                        _serialize_detection(i, det)
                                         for i, det in enumerate(all_stream_detections.get(stream_id, []))
                                     ],
                                     "tracks": [
-                                        {
-                                            "id": str(track.track_id),
-                                            "bbox": [float(x) for x in track.bbox],
-                                            "confidence": float(track.confidence),
-                                            "class_name": "person",  # Default for now
-                                            "center": [
-                                                float((track.bbox[0] + track.bbox[2]) / 2),
-                                                float((track.bbox[1] + track.bbox[3]) / 2),
-                                            ],
-                                        }
-                                        for track in all_stream_tracks.get(stream_id, [])
+                                        _serialize_track(track) for track in all_stream_tracks.get(stream_id, [])
                                     ],
                                 }
                                 for stream_id in active_stream_ids
                             },
-                            "bev_tracks": make_json_serializable(
-                                self._aggregate_bev_tracks_by_global_id(vision_result.bev_tracks)
-                            ),
+                            "bev_tracks": self._aggregate_bev_tracks_by_global_id(vision_result.bev_tracks),
                         }
 
-                        # Debug logging
-                        sum(len(stream_data) for stream_data in all_stream_detections.values())
-                        sum(
-                            1
-                            for track in vision_result.bev_tracks
-                            if hasattr(track, "trajectory") and track.trajectory and len(track.trajectory) > 1
-                        )
+                        # Debug logging (only computed when debug output is enabled)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            total_detections = sum(len(stream_data) for stream_data in all_stream_detections.values())
+                            tracks_with_trajectory = sum(
+                                1
+                                for track in vision_result.bev_tracks
+                                if getattr(track, "trajectory", None) is not None and len(track.trajectory) > 1
+                            )
+                            logger.debug(
+                                "Sending vision frame %s: %d detections, %d BEV tracks with trajectories",
+                                vision_result.frame_id,
+                                total_detections,
+                                tracks_with_trajectory,
+                            )
 
                         # Send the message (either vision data or status)
                         if metadata:
                             await self.broadcast(metadata)
 
-                    # Sleep for a short time to prevent excessive CPU usage
-                    await asyncio.sleep(0.01)  # 100 Hz polling, only send when data changes
-
                 except Exception as e:  # noqa: PERF203
                     logger.error(f"Error in vision transmission loop: {e}")
                     await asyncio.sleep(0.1)  # Shorter wait on error
@@ -202,32 +228,46 @@ class VisionWebSocketManager:
         except Exception as e:
             logger.error(f"Vision transmission loop error: {e}")
 
+    def _get_status_message(self, timestamp: float) -> dict[str, Any]:
+        """Return the periodic status message, reusing the template built on first use"""
+        if self._status_template is None:
+            self._status_template = {
+                "type": "vision_status",
+                "timestamp": timestamp,
+                "tracking_enabled": True,
+                "active_stream_ids": [stream["id"] for stream in ServerConfig.get_enabled_streams()],
+                "message": "Vision tracking active, waiting for video frames...",
+            }
+        self._status_template["timestamp"] = timestamp
+        return self._status_template
+
     async def broadcast(self, message: dict):
         """Send message to all connected clients with minimal latency"""
         if not self.active_connections:
             return
 
-        message_str = json.dumps(message, separators=(",", ":"))  # Compact JSON
-        disconnected = set()
-
-        # Send to all clients concurrently for maximum speed
-        tasks = []
-        for websocket in self.active_connections:
-            task = asyncio.create_task(self._send_to_client(websocket, message_str, disconnected))
-            tasks.append(task)
+        # Encode once and share the same UTF-8 payload with every client as a binary frame,
+        # instead of letting each send_text call re-encode the string per connection
+        payload = json.dumps(message, separators=(",", ":")).encode()  # Compact JSON
+        disconnected: set[WebSocket] = set()
 
-        # Wait for all sends to complete
-        if tasks:
-            await asyncio.gather(*tasks, return_exceptions=True)
+        # Snapshot the client list, then send concurrently in bounded batches
+        clients = self.active_connections.copy()
+        for start in range(0, len(clients), BROADCAST_BATCH_SIZE):
+            batch = clients[start : start + BROADCAST_BATCH_SIZE]
+            await asyncio.gather(
+                *(self._send_to_client(websocket, payload, disconnected) for websocket in batch),
+                return_exceptions=True,
+            )
 
         # Remove disconnected clients
         for websocket in disconnected:
             self.disconnect(websocket)
 
-    async def _send_to_client(self, websocket: WebSocket, message_str: str, disconnected: set):
+    async def _send_to_client(self, websocket: WebSocket, payload: bytes, disconnected: set):
         """Send message to a single client"""
         try:
-            await websocket.send_text(message_str)
+            await websocket.send_bytes(payload)
         except Exception:
             disconnected.add(websocket)
 
@@ -235,6 +275,7 @@ class VisionWebSocketManager:
         """
         Aggregate BEV tracks by global_id, averaging positions for tracks with the same ID.
         This ensures only one point is shown on the BEV view for objects tracked by multiple cameras.
+        The returned dictionaries contain only JSON-native types.
         """
         # Group tracks by global_id
         global_id_groups = {}
@@ -261,15 +302,13 @@ class VisionWebSocketManager:
                 aggregated_tracks.append(
                     {
                         "id": f"global_{global_id}",  # Use global ID as the primary ID
-                        "position": [track.bev_x, track.bev_y],
+                        "position": [float(track.bev_x), float(track.bev_y)],
                         "velocity": [0, 0],  # TODO: Calculate velocity
-                        "confidence": track.confidence,
+                        "confidence": float(track.confidence),
                         "class_name": "person",  # Default for now
-                        "global_id": global_id,
-                        "trajectory": track.trajectory
-                        if hasattr(track, "trajectory") and track.trajectory is not None
-                        else [],
-                        "cameras": [track.camera_id] if hasattr(track, "camera_id") else [],
+                        "global_id": int(global_id),
+                        "trajectory": _trajectory_to_list(getattr(track, "trajectory", None)),
+                        "cameras": [int(track.camera_id)] if hasattr(track, "camera_id") else [],
                         "source": "single_camera",
                     }
                 )
@@ -282,23 +321,22 @@ class VisionWebSocketManager:
                 # Use the trajectory from the first track (they should be the same)
                 trajectory = None
                 for track in track_group:
-                    if hasattr(track, "trajectory") and track.trajectory:
+                    if hasattr(track, "trajectory") and track.trajectory is not None and len(track.trajectory):
                         trajectory = track.trajectory
                         break
 
                 # Collect all camera IDs
-                camera_ids = []
-                camera_ids = [track.camera_id for track in track_group if hasattr(track, "camera_id")]
+                camera_ids = [int(track.camera_id) for track in track_group if hasattr(track, "camera_id")]
 
                 aggregated_tracks.append(
                     {
                         "id": f"global_{global_id}",  # Use global ID as the primary ID
-                        "position": [avg_x, avg_y],
+                        "position": [float(avg_x), float(avg_y)],
                         "velocity": [0, 0],  # TODO: Calculate velocity
-                        "confidence": avg_confidence,
+                        "confidence": float(avg_confidence),
                         "class_name": "person",  # Default for now
-                        "global_id": global_id,
-                        "trajectory": trajectory if trajectory is not None else [],
+                        "global_id": int(global_id),
+                        "trajectory": _trajectory_to_list(trajectory),
                         "cameras": camera_ids,
                         "source": "multi_camera",
                     }
@@ -308,16 +346,14 @@ class VisionWebSocketManager:
         aggregated_tracks.extend(
             [
                 {
-                    "id": track.track_id,
-                    "position": [track.bev_x, track.bev_y],
+                    "id": str(track.track_id),
+                    "position": [float(track.bev_x), float(track.bev_y)],
                     "velocity": [0, 0],  # TODO: Calculate velocity
-                    "confidence": track.confidence,
+                    "confidence": float(track.confidence),
                     "class_name": "person",  # Default for now
                     "global_id": None,
-                    "trajectory": track.trajectory
-                    if hasattr(track, "trajectory") and track.trajectory is not None
-                    else [],
-                    "cameras": [track.camera_id] if hasattr(track, "camera_id") else [],
+                    "trajectory": _trajectory_to_list(getattr(track, "trajectory", None)),
+                    "cameras": [int(track.camera_id)] if hasattr(track, "camera_id") else [],
                     "source": "no_global_id",
                 }
                 for track in tracks_without_global_id
@@ -7,16 +7,23 @@ based on configuration, enabling easy extensibility for new algorithms.
 
 import logging
 import os
+from typing import TYPE_CHECKING
 
 from trackstudio.config_registry import get_merger_names, get_registered_merger_configs
 from trackstudio.mergers.base import VisionMerger
 from trackstudio.mergers.bev_cluster import BEVClusterMerger
-from trackstudio.models.reid_extractor import TorchReIDExtractor
 from trackstudio.trackers.base import VisionTracker
 from trackstudio.vision_config import VisionSystemConfig
 
+# The ReID stack (torch, torchreid) is only imported when a ReID extractor is created
+if TYPE_CHECKING:
+    from trackstudio.models.reid_extractor import TorchReIDExtractor
+
 logger = logging.getLogger(__name__)
 
+# Merger classes resolved from dynamically registered merger types
+_MERGER_CLASS_CACHE: dict[str, type[VisionMerger]] = {}
+
 
 def create_merger(config: VisionSystemConfig, _tracker: VisionTracker | None = None) -> VisionMerger:
     """
@@ -42,12 +49,7 @@ def create_merger(config: VisionSystemConfig, _tracker: VisionTracker | None = N
     if merger_type in registered_configs:
         logger.info(f"🔧 Creating registered merger: {merger_type}")
         try:
-            # Try to import from mergers module
-            module_name = f"vision.mergers.{merger_type}_merger"
-            merger_class_name = f"{merger_type.replace('_', '').title()}Merger"
-
-            module = __import__(module_name, fromlist=[merger_class_name])
-            merger_class = getattr(module, merger_class_name)
+            merger_class = _load_merger_class(merger_type)
 
             # Most mergers will need ReID extractor
             reid_extractor = _create_reid_extractor()
@@ -63,7 +65,21 @@ def create_merger(config: VisionSystemConfig, _tracker: VisionTracker | None = N
         return _create_bev_cluster_merger(merger_config)
 
 
-def _create_reid_extractor() -> TorchReIDExtractor | None:
+def _load_merger_class(merger_type: str) -> type[VisionMerger]:
+    """Import the class for a registered merger type, caching it for later calls"""
+    merger_class = _MERGER_CLASS_CACHE.get(merger_type)
+    if merger_class is None:
+        # Try to import from mergers module
+        module_name = f"vision.mergers.{merger_type}_merger"
+        merger_class_name = f"{merger_type.replace('_', '').title()}Merger"
+
+        module = __import__(module_name, fromlist=[merger_class_name])
+        merger_class = getattr(module, merger_class_name)
+        _MERGER_CLASS_CACHE[merger_type] = merger_class
+    return merger_class
+
+
+def _create_reid_extractor() -> "TorchReIDExtractor | None":
     """Create ReID extractor using singleton pattern for memory efficiency"""
     from trackstudio.models.reid_singleton import get_reid_extractor  # noqa: PLC0415
 
@@ -5,17 +5,26 @@ This module implements cross-camera tracking using bird's eye view clustering
 and appearance-based features for associating tracks across multiple cameras.
 """
 
+import heapq
 import logging
-from dataclasses import dataclass
-from typing import Any
+from collections import deque
+from dataclasses import dataclass, field
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
 
-from ..models.reid_extractor import TorchReIDExtractor
 from ..trackers.base import BEVTrack
 from ..vision_config import CrossCameraConfig
 from .base import VisionMerger
 
+# The ReID extractor is injected by the merger factory; importing it here would pull in torch
+if TYPE_CHECKING:
+    from ..models.reid_extractor import TorchReIDExtractor
+
 logger = logging.getLogger(__name__)
 
 
@@ -25,23 +34,21 @@ class GlobalTrack:
     Represents a global track that may span multiple cameras.
 
     This class maintains the state of a track across multiple camera views,
-    including position history, appearance features, and camera associations.
+    including position history and camera associations.
 
     Attributes:
         global_id: Unique identifier for this global track
         camera_tracks: Mapping from camera_id to local track_id
         last_seen: Timestamp when this track was last updated
-        positions: History of (x, y, timestamp) positions
-        appearance_features: Averaged appearance features across cameras
+        positions: Recent (x, y, timestamp) positions, oldest first and bounded in length
         smoothed_position: Current smoothed position estimate
         velocity: Current velocity estimate (vx, vy)
     """
 
-    global_id: str
+    global_id: int
     camera_tracks: dict[int, str]  # camera_id -> local_track_id
     last_seen: float
-    positions: list[tuple[float, float, float]]  # (x, y, timestamp)
-    appearance_features: np.ndarray | None = None
+    positions: deque[tuple[float, float, float]]  # (x, y, timestamp)
     smoothed_position: tuple[float, float] | None = None
     velocity: tuple[float, float] = (0.0, 0.0)
 
@@ -58,8 +65,10 @@ class TrackCandidate:
         camera_id: ID of the source camera
         local_track_id: Local track ID within the camera
         position: Current position in BEV coordinates
-        appearance_features: Optional appearance features for matching
+        appearance_features: Optional L2-normalized appearance features for matching
         original_bev_track: Original BEV track object
+        index: Row of this candidate in the per-frame feature matrix
+        mapping_key: (camera_id, local_track_id) key into the merger's track ID mapping
     """
 
     camera_id: int
@@ -67,6 +76,11 @@ class TrackCandidate:
     position: tuple[float, float]
     appearance_features: np.ndarray | None
     original_bev_track: BEVTrack
+    index: int = 0
+    mapping_key: tuple[int, str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.mapping_key = (self.camera_id, self.local_track_id)
 
 
 class BEVClusterMerger(VisionMerger):
@@ -87,7 +101,7 @@ class BEVClusterMerger(VisionMerger):
         multi_camera_associations: Number of successful cross-camera associations
     """
 
-    def __init__(self, config: CrossCameraConfig, reid_extractor: TorchReIDExtractor | None = None) -> None:
+    def __init__(self, config: CrossCameraConfig, reid_extractor: "TorchReIDExtractor | None" = None) -> None:
         """
         Initialize the BEV cluster merger.
 
@@ -99,12 +113,19 @@ class BEVClusterMerger(VisionMerger):
         self.config = config
         self.reid_extractor = reid_extractor
 
-        self.global_tracks: dict[str, GlobalTrack] = {}
+        self.global_tracks: dict[int, GlobalTrack] = {}
         self.next_global_id = 1
-        self.track_id_mapping: dict[tuple[int, str], str] = {}
+        self.track_id_mapping: dict[tuple[int, str], int] = {}
         self.total_tracks_created = 0
         self.multi_camera_associations = 0
 
+        # Min-heap of (last_seen, global_id); entries are superseded lazily when a track is seen again
+        self._last_seen_heap: list[tuple[float, int]] = []
+
+        # Per-frame stacked appearance features, rows indexed by TrackCandidate.index
+        self._frame_features = np.zeros((0, 0), dtype=np.float32)
+        self._frame_has_features = np.zeros(0, dtype=bool)
+
     def merge(
         self,
         bev_tracks: list[BEVTrack],
@@ -135,19 +156,46 @@ class BEVClusterMerger(VisionMerger):
         self._cleanup_old_tracks(timestamp)
 
         track_candidates: list[TrackCandidate] = []
-        for bev_track in bev_tracks:
+        for index, bev_track in enumerate(bev_tracks):
+            track_id = bev_track.track_id
             candidate = TrackCandidate(
                 camera_id=bev_track.camera_id,
-                local_track_id=str(bev_track.track_id),
+                local_track_id=track_id,
                 position=(bev_track.bev_x, bev_track.bev_y),
-                appearance_features=reid_features.get(str(bev_track.track_id)),
+                appearance_features=reid_features.get(track_id),
                 original_bev_track=bev_track,
+                index=index,
             )
             track_candidates.append(candidate)
 
+        self._stack_frame_features(track_candidates)
         clusters = self._cluster_tracks(track_candidates)
         return self._assign_global_ids_to_clusters(clusters, timestamp)
 
+    def _stack_frame_features(self, candidates: list[TrackCandidate]) -> None:
+        """
+        Stack candidate appearance features into one contiguous float32 matrix.
+
+        Rows are L2-normalized here so cosine similarity is a plain dot product
+        regardless of the tracker's feature scaling. Rows for candidates without
+        features are left as zeros and flagged in the parallel ``_frame_has_features`` mask.
+
+        Args:
+            candidates: Track candidates for the current frame
+        """
+        present = [c for c in candidates if c.appearance_features is not None]
+        feature_dim = present[0].appearance_features.shape[-1] if present else 0
+
+        features = np.zeros((len(candidates), feature_dim), dtype=np.float32)
+        has_features = np.zeros(len(candidates), dtype=bool)
+        for candidate in present:
+            features[candidate.index] = candidate.appearance_features
+            has_features[candidate.index] = True
+        features /= np.linalg.norm(features, axis=1, keepdims=True) + 1e-8
+
+        self._frame_features = features
+        self._frame_has_features = has_features
+
     def _cluster_tracks(self, candidates: list[TrackCandidate]) -> list[list[TrackCandidate]]:
         """
         Cluster track candidates based on spatial and appearance similarity.
@@ -165,66 +213,38 @@ class BEVClusterMerger(VisionMerger):
             return []
 
         n = len(candidates)
-        adj_matrix = np.zeros((n, n), dtype=bool)
-
-        # Build adjacency matrix based on similarity
-        for i in range(n):
-            for j in range(i + 1, n):
-                # Don't cluster tracks from the same camera
-                if candidates[i].camera_id == candidates[j].camera_id:
-                    continue
-
-                # Check spatial distance
-                spatial_dist = np.linalg.norm(np.array(candidates[i].position) - np.array(candidates[j].position))
-                if spatial_dist > self.config.spatial_threshold:
-                    continue
-
-                # Check appearance similarity if features available
-                feat_i = candidates[i].appearance_features
-                feat_j = candidates[j].appearance_features
-                if feat_i is not None and feat_j is not None:
-                    cosine_sim = np.dot(feat_i, feat_j) / (np.linalg.norm(feat_i) * np.linalg.norm(feat_j) + 1e-8)
-                    appearance_dist = 1.0 - cosine_sim
-                    if appearance_dist > self.config.appearance_threshold:
-                        continue
-
-                # Mark as connected if all criteria met
-                adj_matrix[i, j] = adj_matrix[j, i] = True
-
-        # Find connected components using DFS
-        visited = [False] * n
-        clusters: list[list[TrackCandidate]] = []
-        for i in range(n):
-            if not visited[i]:
-                cluster: list[TrackCandidate] = []
-                self._dfs(i, adj_matrix, visited, cluster, candidates)
-                clusters.append(cluster)
 
-        return clusters
-
-    def _dfs(
-        self,
-        u: int,
-        adj: np.ndarray,
-        visited: list[bool],
-        cluster: list[TrackCandidate],
-        candidates: list[TrackCandidate],
-    ) -> None:
-        """
-        Depth-first search to find connected components in the track graph.
+        # Only pairs within the spatial threshold can ever be clustered
+        positions = np.asarray([c.position for c in candidates], dtype=np.float64)
+        pairs = cKDTree(positions).query_pairs(r=self.config.spatial_threshold, output_type="ndarray")
+        rows, cols = pairs[:, 0], pairs[:, 1]
+
+        # Don't cluster tracks from the same camera
+        camera_ids = np.array([c.camera_id for c in candidates])
+        cross_camera = camera_ids[rows] != camera_ids[cols]
+        rows, cols = rows[cross_camera], cols[cross_camera]
+
+        # Check appearance similarity where both tracks have features; rows were unit-normalized
+        # in _stack_frame_features, so cosine similarity is a plain dot product
+        has_features = self._frame_has_features
+        both_have_features = has_features[rows] & has_features[cols]
+        if both_have_features.any():
+            features = self._frame_features
+            appearance_ok = np.ones(len(rows), dtype=bool)
+            feat_rows, feat_cols = rows[both_have_features], cols[both_have_features]
+            cosine_sim = np.einsum("ij,ij->i", features[feat_rows], features[feat_cols])
+            appearance_ok[both_have_features] = 1.0 - cosine_sim <= self.config.appearance_threshold
+            rows, cols = rows[appearance_ok], cols[appearance_ok]
+
+        adj_matrix = csr_matrix((np.ones(len(rows), dtype=bool), (rows, cols)), shape=(n, n))
+
+        # Find connected components of the track graph
+        n_clusters, labels = connected_components(adj_matrix, directed=False)
+        clusters: list[list[TrackCandidate]] = [[] for _ in range(n_clusters)]
+        for candidate, label in zip(candidates, labels.tolist(), strict=True):
+            clusters[label].append(candidate)
 
-        Args:
-            u: Current node index
-            adj: Adjacency matrix
-            visited: List of visited flags
-            cluster: Current cluster being built
-            candidates: List of all track candidates
-        """
-        visited[u] = True
-        cluster.append(candidates[u])
-        for v in range(len(candidates)):
-            if adj[u, v] and not visited[v]:
-                self._dfs(v, adj, visited, cluster, candidates)
+        return clusters
 
     def _assign_global_ids_to_clusters(self, clusters: list[list[TrackCandidate]], timestamp: float) -> list[BEVTrack]:
         """
@@ -246,31 +266,29 @@ class BEVClusterMerger(VisionMerger):
             if len(cluster) == 1:
                 # Single track - check if it's already in a global track
                 candidate = cluster[0]
-                key = (candidate.camera_id, candidate.local_track_id)
-
-                if key in self.track_id_mapping:
-                    global_id = self.track_id_mapping[key]
-                    if global_id in self.global_tracks:
-                        self.global_tracks[global_id].last_seen = timestamp
-                        self.global_tracks[global_id].positions.append(
-                            (candidate.position[0], candidate.position[1], timestamp)
-                        )
+                global_id = self.track_id_mapping.get(candidate.mapping_key)
+
+                if global_id is not None:
+                    global_track = self.global_tracks.get(global_id)
+                    if global_track is not None:
+                        self._touch_global_track(global_track, timestamp)
+                        global_track.positions.append((candidate.position[0], candidate.position[1], timestamp))
                 else:
                     global_id = self._create_new_global_track_for_cluster(cluster, timestamp)
-                    self.track_id_mapping[key] = global_id
+                    self.track_id_mapping[candidate.mapping_key] = global_id
 
                 # Create updated BEV track
                 updated_track = candidate.original_bev_track
-                updated_track.global_id = int(global_id)
+                updated_track.global_id = global_id
                 updated_tracks.append(updated_track)
 
             else:
                 # Multi-camera cluster - merge or create new global track
-                existing_global_ids: set[str] = set()
+                existing_global_ids: set[int] = set()
                 for candidate in cluster:
-                    key = (candidate.camera_id, candidate.local_track_id)
-                    if key in self.track_id_mapping:
-                        existing_global_ids.add(self.track_id_mapping[key])
+                    existing_id = self.track_id_mapping.get(candidate.mapping_key)
+                    if existing_id is not None:
+                        existing_global_ids.add(existing_id)
 
                 if existing_global_ids:
                     # Merge with existing tracks
@@ -282,16 +300,15 @@ class BEVClusterMerger(VisionMerger):
 
                 # Update all candidates with the same global ID
                 for candidate in cluster:
-                    key = (candidate.camera_id, candidate.local_track_id)
-                    self.track_id_mapping[key] = primary_id
+                    self.track_id_mapping[candidate.mapping_key] = primary_id
 
                     updated_track = candidate.original_bev_track
-                    updated_track.global_id = int(primary_id)
+                    updated_track.global_id = primary_id
                     updated_tracks.append(updated_track)
 
         return updated_tracks
 
-    def _create_new_global_track_for_cluster(self, cluster: list[TrackCandidate], timestamp: float) -> str:
+    def _create_new_global_track_for_cluster(self, cluster: list[TrackCandidate], timestamp: float) -> int:
         """
         Create a new global track for a cluster of candidates.
 
@@ -302,28 +319,24 @@ class BEVClusterMerger(VisionMerger):
         Returns:
             Global ID of the newly created track
         """
-        global_id = str(self.next_global_id)
+        global_id = self.next_global_id
         self.next_global_id += 1
 
         # Calculate average position
-        avg_x = float(np.mean([c.position[0] for c in cluster]))
-        avg_y = float(np.mean([c.position[1] for c in cluster]))
-
-        # Average appearance features if available
-        features = [c.appearance_features for c in cluster if c.appearance_features is not None]
-        avg_features = np.mean(features, axis=0) if features else None
+        avg_x = sum(c.position[0] for c in cluster) / len(cluster)
+        avg_y = sum(c.position[1] for c in cluster) / len(cluster)
 
         self.global_tracks[global_id] = GlobalTrack(
             global_id=global_id,
             camera_tracks={c.camera_id: c.local_track_id for c in cluster},
             last_seen=timestamp,
-            positions=[(avg_x, avg_y, timestamp)],
-            appearance_features=avg_features,
+            positions=deque([(avg_x, avg_y, timestamp)], maxlen=self.config.max_history_frames),
         )
+        heapq.heappush(self._last_seen_heap, (timestamp, global_id))
         self.total_tracks_created += 1
         return global_id
 
-    def _merge_global_tracks(self, global_ids: set[str], timestamp: float) -> str:
+    def _merge_global_tracks(self, global_ids: set[int], timestamp: float) -> int:
         """
         Merge multiple global tracks into one.
 
@@ -334,23 +347,18 @@ class BEVClusterMerger(VisionMerger):
         Returns:
             Primary global ID after merging
         """
-        primary_id = min(global_ids, key=int)
+        primary_id = min(global_ids)
         primary_track = self.global_tracks[primary_id]
 
         for gid in global_ids:
             if gid != primary_id and gid in self.global_tracks:
                 other_track = self.global_tracks[gid]
                 primary_track.camera_tracks.update(other_track.camera_tracks)
-                primary_track.positions.extend(other_track.positions)
-
-                # Merge appearance features
-                if other_track.appearance_features is not None:
-                    if primary_track.appearance_features is None:
-                        primary_track.appearance_features = other_track.appearance_features
-                    else:
-                        primary_track.appearance_features = (
-                            primary_track.appearance_features + other_track.appearance_features
-                        ) / 2.0
+                # Both histories are already in timestamp order
+                primary_track.positions = deque(
+                    heapq.merge(primary_track.positions, other_track.positions, key=itemgetter(2)),
+                    maxlen=self.config.max_history_frames,
+                )
 
                 # Update track mappings
                 for cam_id, track_id in other_track.camera_tracks.items():
@@ -358,35 +366,49 @@ class BEVClusterMerger(VisionMerger):
 
                 del self.global_tracks[gid]
 
-        # Sort positions by timestamp and update last seen
-        primary_track.positions.sort(key=lambda p: p[2])
-        primary_track.last_seen = timestamp
+        self._touch_global_track(primary_track, timestamp)
         return primary_id
 
+    def _touch_global_track(self, track: GlobalTrack, timestamp: float) -> None:
+        """
+        Update a global track's last seen time and record it for expiry.
+
+        Args:
+            track: Global track that was observed
+            timestamp: Current timestamp
+        """
+        track.last_seen = timestamp
+        heapq.heappush(self._last_seen_heap, (timestamp, track.global_id))
+
     def _cleanup_old_tracks(self, current_timestamp: float) -> None:
         """
         Remove expired global tracks based on age.
 
+        Only the oldest heap entries are inspected, so the cost is proportional to the
+        number of expired entries rather than the number of active tracks.
+
         Args:
             current_timestamp: Current timestamp for age calculation
         """
-        expired_ids: list[str] = []
-        for global_id, track in self.global_tracks.items():
-            age_seconds = current_timestamp - track.last_seen
-            if age_seconds > self.config.max_track_age_s:
-                expired_ids.append(global_id)
-
-                # Remove from mapping
-                for cam_id, local_id in track.camera_tracks.items():
-                    key = (cam_id, local_id)
-                    if key in self.track_id_mapping:
-                        del self.track_id_mapping[key]
-
-        for global_id in expired_ids:
+        heap = self._last_seen_heap
+        expired_count = 0
+        while heap and current_timestamp - heap[0][0] > self.config.max_track_age_s:
+            last_seen, global_id = heapq.heappop(heap)
+            track = self.global_tracks.get(global_id)
+
+            # Skip entries for merged-away tracks or tracks that were seen again since
+            if track is None or track.last_seen != last_seen:
+                continue
+
+            # Remove from mapping
+            for cam_id, local_id in track.camera_tracks.items():
+                self.track_id_mapping.pop((cam_id, local_id), None)
+
             del self.global_tracks[global_id]
+            expired_count += 1
 
-        if expired_ids:
-            logger.debug(f"🧹 Cleaned up {len(expired_ids)} expired global tracks")
+        if expired_count:
+            logger.debug(f"🧹 Cleaned up {expired_count} expired global tracks")
 
     def get_statistics(self) -> dict[str, Any]:
         """
@@ -5,13 +5,24 @@ This module provides a wrapper for TorchReID's feature extraction functionality,
 enabling deep learning-based person re-identification features.
 """
 
+import contextlib
 import logging
+import threading
 
 import numpy as np
 import torch
+from torchvision.ops import roi_align
 
 logger = logging.getLogger(__name__)
 
+# Pixel normalization used by TorchReID's FeatureExtractor preprocessing
+PIXEL_MEAN = (0.485, 0.456, 0.406)
+PIXEL_STD = (0.229, 0.224, 0.225)
+
+# Dummy batch sizes run through the compiled model at startup; batch size 1 is specialized
+# by torch.compile, so the larger sizes warm the dynamic-shape graph
+_COMPILE_WARMUP_BATCH_SIZES = (1, 2, 8)
+
 
 class TorchReIDExtractor:
     """Wrapper for TorchReID feature extraction"""
@@ -36,6 +47,16 @@ class TorchReIDExtractor:
             self.device = device
 
         self.extractor = None
+        self._dtype = torch.float32
+        self._blank_feature: np.ndarray | None = None
+        self._model: torch.nn.Module | None = None
+
+        # Reusable pinned staging buffer and side stream for frame uploads on CUDA
+        self._pinned_frame: torch.Tensor | None = None
+        self._stream = torch.cuda.Stream(device=self.device) if self.device.startswith("cuda") else None
+
+        # The extractor is a shared singleton; serializes use of the staging buffer and model across threads
+        self._inference_lock = threading.Lock()
         self._initialize_extractor()
 
         # Verify extractor was properly initialized
@@ -66,6 +87,21 @@ class TorchReIDExtractor:
                 device=self.device,
                 image_size=self.image_size,
             )
+            # Run in half precision on CUDA; the CPU path stays in FP32
+            if self.device.startswith("cuda"):
+                self.extractor.model.half()
+                self._dtype = torch.float16
+
+                # Compile the model for fused kernels; batch size varies per frame, so keep shapes dynamic
+                self._model = torch.compile(self.extractor.model.eval(), dynamic=True)
+            else:
+                self._model = self.extractor.model
+
+            # Normalization constants kept on the device for the batched crop pipeline
+            self._pixel_mean = torch.tensor(PIXEL_MEAN, device=self.device).view(1, 3, 1, 1)
+            self._pixel_std = torch.tensor(PIXEL_STD, device=self.device).view(1, 3, 1, 1)
+            if self._model is not self.extractor.model and self.device.startswith("cuda"):
+                self._warmup_compiled_model()
             logger.info(f"✅ TorchReID extractor initialized: {self.model_name} on {self.device}")
 
         except ImportError as e:
@@ -76,12 +112,137 @@ class TorchReIDExtractor:
             logger.error(f"❌ Failed to initialize TorchReID extractor: {e}")
             raise RuntimeError(f"TorchReID extractor initialization failed: {e}") from e
 
-    def extract_features(self, frame: np.ndarray, detections) -> np.ndarray | None:
+    def _warmup_compiled_model(self) -> None:
+        """
+        Warm up the compiled ReID model on dummy batches.
+
+        Compilation is lazy, so a few batches are pushed through _run_model here to pay
+        its cost before the first real frame. If compilation fails, _run_model has
+        already dropped back to the eager model.
+        """
+        with torch.inference_mode(), self._autocast():
+            for batch_size in _COMPILE_WARMUP_BATCH_SIZES:
+                self._run_model(torch.zeros((batch_size, 3, *self.image_size), device=self.device))
+                if self._model is self.extractor.model:
+                    return
+        logger.info("⚡ ReID model compiled with torch.compile")
+
+    def _autocast(self) -> torch.autocast:
+        """Autocast context for FP16 inference on CUDA (disabled on CPU)"""
+        return torch.autocast(device_type="cuda", dtype=torch.float16, enabled=self._dtype == torch.float16)
+
+    def _upload_frame(self, frame: np.ndarray | torch.Tensor) -> torch.Tensor:
+        """
+        Copy a frame to the device, staging it through a reused pinned buffer on CUDA
+
+        Args:
+            frame: Input frame (H, W, 3), either a host array or a tensor already on the device
+
+        Returns:
+            Frame tensor on the device with shape (H, W, 3)
+        """
+        if isinstance(frame, torch.Tensor):
+            if self._stream is not None:
+                # The tensor was produced on the default stream; order the side stream after it
+                self._stream.wait_stream(torch.cuda.default_stream(self._stream.device))
+            return frame.to(self.device)
+
+        if self._stream is None or frame.dtype != np.uint8:
+            return torch.from_numpy(np.ascontiguousarray(frame)).to(self.device)
+
+        self._pinned_buffer(frame.shape).numpy()[...] = frame
+        return self._pinned_frame.to(self.device, non_blocking=True)
+
+    def _upload_frames(self, frames: list[np.ndarray | torch.Tensor]) -> torch.Tensor:
+        """
+        Copy same-sized frames to the device as one batch, staged through the pinned buffer on CUDA
+
+        Args:
+            frames: Input frames, each (H, W, 3), as host arrays or tensors already on the device
+
+        Returns:
+            Frame batch tensor on the device with shape (B, H, W, 3)
+        """
+        if any(isinstance(frame, torch.Tensor) for frame in frames):
+            return torch.stack([self._upload_frame(frame) for frame in frames])
+
+        if self._stream is None or frames[0].dtype != np.uint8:
+            return torch.from_numpy(np.stack(frames)).to(self.device)
+
+        staging = self._pinned_buffer((len(frames), *frames[0].shape)).numpy()
+        for i, frame in enumerate(frames):
+            staging[i] = frame
+        return self._pinned_frame.to(self.device, non_blocking=True)
+
+    def _pinned_buffer(self, shape: tuple[int, ...]) -> torch.Tensor:
+        """Return the pinned staging buffer, reallocating it when the requested shape changes"""
+        if self._pinned_frame is None or self._pinned_frame.shape != shape:
+            self._pinned_frame = torch.empty(shape, dtype=torch.uint8, pin_memory=True)
+        return self._pinned_frame
+
+    def _run_model(self, crops: torch.Tensor) -> torch.Tensor:
+        """
+        Run the ReID model on a batch of crops
+
+        Args:
+            crops: Crops as an (N, 3, H, W) float tensor with values in [0, 1]
+
+        Returns:
+            L2-normalized float32 features as an (N, feature_dim) tensor
+        """
+        crops = ((crops - self._pixel_mean) / self._pixel_std).to(self._dtype)
+        try:
+            features = self._model(crops)
+        except Exception as e:
+            if self._model is self.extractor.model:
+                raise
+            # Compilation happens lazily on the first call; fall back to the plain model if it fails
+            logger.warning(f"⚠️ Optimized ReID model failed, falling back to the plain model: {e}")
+            self._model = self.extractor.model
+            features = self._model(crops)
+        return torch.nn.functional.normalize(features.float(), dim=1)
+
+    def _get_blank_feature(self) -> np.ndarray:
+        """Feature of an all-black crop, computed once and reused for undersized boxes"""
+        if self._blank_feature is None:
+            with self._inference_lock, torch.inference_mode(), self._autocast():
+                blank = torch.zeros((1, 3, *self.image_size), device=self.device)
+                self._blank_feature = self._run_model(blank).cpu().numpy()[0]
+        return self._blank_feature
+
+    @staticmethod
+    def _prepare_bboxes(bboxes: np.ndarray, h: int, w: int) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Clip boxes to the frame and find those large enough for the model
+
+        Args:
+            bboxes: Boxes as (N, 4) array with [x1, y1, x2, y2] format
+            h: Frame height
+            w: Frame width
+
+        Returns:
+            Tuple of (clipped integer boxes, indices of boxes of at least 10x10 pixels)
+        """
+        # Convert to numpy array and validate bounds
+        bboxes = np.array(bboxes)
+        bboxes[:, 0] = np.clip(bboxes[:, 0], 0, w - 1)
+        bboxes[:, 1] = np.clip(bboxes[:, 1], 0, h - 1)
+        bboxes[:, 2] = np.clip(bboxes[:, 2], bboxes[:, 0] + 1, w)
+        bboxes[:, 3] = np.clip(bboxes[:, 3], bboxes[:, 1] + 1, h)
+
+        # Ensure bboxes are integers
+        bboxes = bboxes.astype(int)
+
+        # Only boxes of at least 10x10 pixels are run through the model
+        valid = ((bboxes[:, 2] - bboxes[:, 0]) >= 10) & ((bboxes[:, 3] - bboxes[:, 1]) >= 10)
+        return bboxes, np.flatnonzero(valid)
+
+    def extract_features(self, frame: np.ndarray | torch.Tensor, detections) -> np.ndarray | None:
         """
         Extract ReID features from detected persons
 
         Args:
-            frame: Input frame (H, W, 3)
+            frame: Input frame (H, W, 3), either a host array or a uint8 tensor already on the device
             detections: supervision.Detections object or bboxes as (N, 4) array with [x1, y1, x2, y2] format
 
         Returns:
@@ -114,52 +275,29 @@ class TorchReIDExtractor:
         if len(bboxes) == 0:
             return np.array([])
 
-        # Convert to numpy array and validate bounds
-        bboxes = np.array(bboxes)
-        h, w = frame.shape[:2]
-        bboxes[:, 0] = np.clip(bboxes[:, 0], 0, w - 1)
-        bboxes[:, 1] = np.clip(bboxes[:, 1], 0, h - 1)
-        bboxes[:, 2] = np.clip(bboxes[:, 2], bboxes[:, 0] + 1, w)
-        bboxes[:, 3] = np.clip(bboxes[:, 3], bboxes[:, 1] + 1, h)
+        bboxes, valid_rows = self._prepare_bboxes(bboxes, *frame.shape[:2])
 
         try:
-            # Ensure bboxes are integers
-            bboxes = bboxes.astype(int)
-
-            # Extract person crops
-            crops = []
-            h, w = frame.shape[:2]
-
-            for bbox in bboxes:
-                x1, y1, x2, y2 = bbox
-
-                # Ensure bbox is within frame bounds
-                x1 = max(0, min(x1, w - 1))
-                y1 = max(0, min(y1, h - 1))
-                x2 = max(x1 + 1, min(x2, w))
-                y2 = max(y1 + 1, min(y2, h))
-
-                # Skip too small boxes
-                if (x2 - x1) < 10 or (y2 - y1) < 10:
-                    # Add zero feature for invalid boxes
-                    crops.append(np.zeros((10, 10, 3), dtype=np.uint8))
-                    continue
-
-                crop = frame[y1:y2, x1:x2]
-                crops.append(crop)
-
-            if len(crops) == 0:
-                return np.array([])
-
-            # Extract features using TorchReID
-            with torch.no_grad():
-                features = self.extractor(crops)
-
-            # Convert to numpy and normalize
-            features_np = features.cpu().numpy()
-
-            # L2 normalize features
-            return features_np / (np.linalg.norm(features_np, axis=1, keepdims=True) + 1e-8)
+            if len(valid_rows) > 0:
+                stream_context = (
+                    torch.cuda.stream(self._stream) if self._stream is not None else contextlib.nullcontext()
+                )
+                with self._inference_lock, stream_context, torch.inference_mode(), self._autocast():
+                    # Upload the frame once and crop + resize every box in a single kernel
+                    frame_tensor = self._upload_frame(frame)
+                    frame_tensor = frame_tensor.permute(2, 0, 1).unsqueeze(0).float().div_(255.0)
+                    boxes = torch.from_numpy(bboxes[valid_rows]).to(self.device, dtype=torch.float32)
+                    crops = roi_align(frame_tensor, [boxes], output_size=self.image_size, aligned=True)
+                    valid_features = self._run_model(crops).cpu().numpy()
+
+                if len(valid_rows) == len(bboxes):
+                    return valid_features
+
+            # Too small boxes get the feature of a blank crop, so callers still receive one row per box
+            features_np = np.repeat(self._get_blank_feature()[None, :], len(bboxes), axis=0)
+            if len(valid_rows) > 0:
+                features_np[valid_rows] = valid_features
+            return features_np
 
         except Exception as e:
             logger.error(f"Error extracting features: {e}")
@@ -169,9 +307,12 @@ class TorchReIDExtractor:
         """
         Compute cosine similarity between two sets of features
 
+        Features are expected to be L2-normalized (as returned by ``extract_features``),
+        so cosine similarity reduces to a dot product.
+
         Args:
-            features1: First set of features (N, D)
-            features2: Second set of features (M, D)
+            features1: First set of normalized features (N, D)
+            features2: Second set of normalized features (M, D)
 
         Returns:
             Similarity matrix (N, M) with values in [0, 1]
@@ -179,11 +320,10 @@ class TorchReIDExtractor:
         if len(features1) == 0 or len(features2) == 0:
             return np.array([])
 
-        # Compute cosine similarity
-        similarity = np.dot(features1, features2.T)
+        similarity = features1 @ features2.T
 
-        # Clip to [0, 1] range
-        return np.clip(similarity, 0, 1)
+        # Clip to [0, 1] range in place
+        return np.clip(similarity, 0, 1, out=similarity)
 
     def compute_distance(self, features1: np.ndarray, features2: np.ndarray) -> np.ndarray:
         """
@@ -197,7 +337,8 @@ class TorchReIDExtractor:
             Distance matrix (N, M) with values in [0, 1]
         """
         similarity = self.compute_similarity(features1, features2)
-        return 1.0 - similarity
+        # Reuse the similarity buffer instead of allocating a second (N, M) matrix
+        return np.subtract(1.0, similarity, out=similarity)
 
     def get_feature_dim(self) -> int:
         """Get the dimension of extracted features"""
@@ -210,6 +351,65 @@ class TorchReIDExtractor:
         # Default dimension, actual may vary
         return 512
 
+    def extract_features_multi(
+        self, frames: list[np.ndarray | torch.Tensor], bboxes_list: list[np.ndarray]
+    ) -> list[np.ndarray] | None:
+        """
+        Extract ReID features for boxes from several frames with a single model forward pass
+
+        Args:
+            frames: Input frames (H, W, 3), as host arrays or uint8 tensors already on the device
+            bboxes_list: Boxes per frame as (N_i, 4) arrays with [x1, y1, x2, y2] format
+
+        Returns:
+            Feature vectors per frame as (N_i, feature_dim) arrays, or None if extraction fails
+        """
+        if self.extractor is None:
+            logger.error("Extractor not initialized")
+            return None
+
+        # Frames of different sizes can't share one batch; extract them one by one
+        if len(frames) <= 1 or len({tuple(frame.shape) for frame in frames}) > 1:
+            features_list = [
+                self.extract_features(frame, bboxes) for frame, bboxes in zip(frames, bboxes_list, strict=True)
+            ]
+            return None if any(features is None for features in features_list) else features_list
+
+        try:
+            h, w = frames[0].shape[:2]
+            prepared = [self._prepare_bboxes(bboxes, h, w) for bboxes in bboxes_list]
+
+            valid_features = None
+            if any(len(valid_rows) > 0 for _, valid_rows in prepared):
+                stream_context = (
+                    torch.cuda.stream(self._stream) if self._stream is not None else contextlib.nullcontext()
+                )
+                with self._inference_lock, stream_context, torch.inference_mode(), self._autocast():
+                    # Upload all frames once and crop + resize every box across the batch in a single kernel
+                    frames_tensor = self._upload_frames(frames).permute(0, 3, 1, 2).float().div_(255.0)
+                    boxes = [
+                        torch.from_numpy(bboxes[valid_rows]).to(self.device, dtype=torch.float32)
+                        for bboxes, valid_rows in prepared
+                    ]
+                    crops = roi_align(frames_tensor, boxes, output_size=self.image_size, aligned=True)
+                    valid_features = self._run_model(crops).cpu().numpy()
+
+            # Split the batch back per frame; too small boxes get the feature of a blank crop
+            blank_feature = self._get_blank_feature()
+            features_list = []
+            offset = 0
+            for bboxes, valid_rows in prepared:
+                features_np = np.repeat(blank_feature[None, :], len(bboxes), axis=0)
+                if len(valid_rows) > 0:
+                    features_np[valid_rows] = valid_features[offset : offset + len(valid_rows)]
+                    offset += len(valid_rows)
+                features_list.append(features_np)
+            return features_list
+
+        except Exception as e:
+            logger.error(f"Error extracting features: {e}")
+            return None
+
     def extract_single_feature(self, image: np.ndarray) -> np.ndarray | None:
         """
         Extract feature from a single image (convenience method)
@@ -224,13 +424,14 @@ class TorchReIDExtractor:
             return None
 
         try:
-            with torch.no_grad():
+            with torch.inference_mode(), self._autocast():
                 features = self.extractor([image])
 
-            features_np = features.cpu().numpy()[0]
+            features_np = features.float().cpu().numpy()[0]
 
             # L2 normalize
-            return features_np / (np.linalg.norm(features_np) + 1e-8)
+            features_np /= np.sqrt(np.vdot(features_np, features_np)) + 1e-8
+            return features_np
 
         except Exception as e:
             logger.error(f"Error extracting single feature: {e}")
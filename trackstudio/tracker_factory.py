@@ -8,16 +8,27 @@ It handles dynamic loading, registration, and initialization of tracker componen
 
 import logging
 import os
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
+from functools import lru_cache
+from types import MappingProxyType
 from typing import Any
 
-from trackstudio.config_registry import get_registered_tracker_configs, get_tracker_names
-from trackstudio.trackers.base import VisionTracker
+from trackstudio.config_registry import get_registered_tracker_configs, get_tracker_config_version, get_tracker_names
+from trackstudio.trackers import tracker_registry
+from trackstudio.trackers.base import VisionTracker, _validate_tracker_cls
 from trackstudio.trackers.dummy import DummyVisionTracker
 from trackstudio.vision_config import VisionSystemConfig
 
 logger = logging.getLogger(__name__)
 
+# Log templates for the tracker creation path, formatted lazily by logging
+_LOG_CREATE = "🏭 Creating tracker of type: %s"
+_LOG_CREATE_REGISTERED = "🔧 Creating registered tracker class: %s"
+_LOG_CREATE_DYNAMIC = "🔧 Creating dynamically registered tracker: %s"
+_LOG_CREATE_DUMMY = "🤖 Creating DummyVisionTracker for testing/development"
+_LOG_CREATE_RFDETR = "🎯 Creating RFDETRTracker with object detection"
+_LOG_AVAILABLE = "📋 Available trackers: %s"
+
 
 def create_tracker(config: VisionSystemConfig, calibration_file: str | None = None) -> VisionTracker:
     """
@@ -48,31 +59,17 @@ def create_tracker(config: VisionSystemConfig, calibration_file: str | None = No
     tracker_type = config.tracker_type
     tracker_config = config.get_tracker_config()
 
-    # Get registered tracker configs for dynamic lookup
-    registered_configs = get_registered_tracker_configs()
-
-    logger.info(f"🏭 Creating tracker of type: {tracker_type}")
-
-    if tracker_type == "dummy":
-        logger.info("🤖 Creating DummyVisionTracker for testing/development")
-        return DummyVisionTracker(config=tracker_config, calibration_file=calibration_file)
+    logger.info(_LOG_CREATE, tracker_type)
 
-    if tracker_type == "rfdetr":
-        logger.info("🎯 Creating RFDETRTracker with object detection")
-        try:
-            # Import here to avoid importing when not needed
-            from trackstudio.trackers.rfdetr import RFDETRTracker  # noqa: PLC0415
-
-            return RFDETRTracker(config=tracker_config, calibration_file=calibration_file)
-        except ImportError as e:
-            logger.error(f"❌ Failed to import RFDETRTracker: {e}")
-            logger.error("Required dependencies missing. Install with: pip install rfdetr supervision")
-            raise ImportError(f"RFDETRTracker dependencies not available: {e}") from e
+    # Built-in trackers dispatch directly without consulting the registries
+    builtin_factory = _BUILTIN_FACTORIES.get(tracker_type)
+    if builtin_factory is not None:
+        return builtin_factory(tracker_config, calibration_file)
 
     # Check if it's a directly registered tracker class first
-    elif tracker_type in TRACKER_REGISTRY:
-        logger.info(f"🔧 Creating registered tracker class: {tracker_type}")
-        tracker_class = TRACKER_REGISTRY[tracker_type]
+    if tracker_type in TRACKER_REGISTRY:
+        logger.info(_LOG_CREATE_REGISTERED, tracker_type)
+        tracker_class = tracker_registry.get(tracker_type)
         try:
             return tracker_class(config=tracker_config, calibration_file=calibration_file)
         except Exception as e:
@@ -80,14 +77,67 @@ def create_tracker(config: VisionSystemConfig, calibration_file: str | None = No
             raise RuntimeError(f"Tracker initialization failed: {e}") from e
 
     # Check if it's a dynamically registered tracker config
-    elif tracker_type in registered_configs:
-        logger.info(f"🔧 Creating dynamically registered tracker: {tracker_type}")
+    if tracker_type in get_registered_tracker_configs():
+        logger.info(_LOG_CREATE_DYNAMIC, tracker_type)
         return _create_dynamic_tracker(tracker_type, tracker_config)
-    else:
-        available_trackers = get_tracker_names()
-        error_msg = f"Unsupported tracker type: {tracker_type}. Available trackers: {available_trackers}"
-        logger.error(f"❌ {error_msg}")
-        raise ValueError(error_msg)
+
+    available_trackers = get_tracker_names()
+    error_msg = f"Unsupported tracker type: {tracker_type}. Available trackers: {available_trackers}"
+    logger.error(f"❌ {error_msg}")
+    raise ValueError(error_msg)
+
+
+def _create_dummy_tracker(tracker_config: Any, calibration_file: str | None) -> VisionTracker:
+    """Create the built-in DummyVisionTracker."""
+    logger.info(_LOG_CREATE_DUMMY)
+    return DummyVisionTracker(config=tracker_config, calibration_file=calibration_file)
+
+
+def _rfdetr_options_from_env() -> dict[str, bool]:
+    """
+    Read the RF-DETR startup switches from the environment.
+
+    These only take effect when the detector is built, so they are process settings
+    rather than part of the live-updatable tracker config.
+
+    Environment Variables:
+        RFDETR_OPTIMIZE_FOR_INFERENCE: Export an inference-only model (default: "true")
+        RFDETR_HALF_PRECISION: Run the optimized model in FP16 on CUDA (default: "true")
+        RFDETR_COMPILE_MODEL: torch.compile the optimized model on CUDA (default: "true")
+        RFDETR_USE_CUDA_GRAPH: Replay a CUDA graph for single-frame inference (default: "true")
+        RFDETR_PARALLEL_TRACKING: Update each camera's DeepSORT tracker in a worker thread (default: "false")
+
+    Returns:
+        Keyword arguments for RFDETRTracker
+    """
+    return {
+        "optimize_for_inference": os.getenv("RFDETR_OPTIMIZE_FOR_INFERENCE", "true").lower() == "true",
+        "half_precision": os.getenv("RFDETR_HALF_PRECISION", "true").lower() == "true",
+        "compile_model": os.getenv("RFDETR_COMPILE_MODEL", "true").lower() == "true",
+        "use_cuda_graph": os.getenv("RFDETR_USE_CUDA_GRAPH", "true").lower() == "true",
+        "parallel_tracking": os.getenv("RFDETR_PARALLEL_TRACKING", "false").lower() == "true",
+    }
+
+
+def _create_rfdetr_tracker(tracker_config: Any, calibration_file: str | None) -> VisionTracker:
+    """Create the built-in RFDETRTracker, importing its dependencies on first use."""
+    logger.info(_LOG_CREATE_RFDETR)
+    try:
+        # Import here to avoid importing when not needed
+        from trackstudio.trackers.rfdetr import RFDETRTracker  # noqa: PLC0415
+
+        return RFDETRTracker(config=tracker_config, calibration_file=calibration_file, **_rfdetr_options_from_env())
+    except ImportError as e:
+        logger.error(f"❌ Failed to import RFDETRTracker: {e}")
+        logger.error("Required dependencies missing. Install with: pip install rfdetr supervision")
+        raise ImportError(f"RFDETRTracker dependencies not available: {e}") from e
+
+
+# Factories for trackers that ship with trackstudio, keyed by tracker type
+_BUILTIN_FACTORIES: dict[str, Callable[[Any, str | None], VisionTracker]] = {
+    "dummy": _create_dummy_tracker,
+    "rfdetr": _create_rfdetr_tracker,
+}
 
 
 def _create_dynamic_tracker(tracker_type: str, tracker_config: Any) -> VisionTracker:
@@ -113,7 +163,7 @@ def _create_dynamic_tracker(tracker_type: str, tracker_config: Any) -> VisionTra
         module_name = f"vision.trackers.{tracker_type}_tracker"
         tracker_class_name = f"{tracker_type.title()}Tracker"
 
-        logger.debug(f"Attempting to import {tracker_class_name} from {module_name}")
+        logger.debug("Attempting to import %s from %s", tracker_class_name, module_name)
         module = __import__(module_name, fromlist=[tracker_class_name])
         tracker_class = getattr(module, tracker_class_name)
 
@@ -148,7 +198,7 @@ def get_tracker_type_from_env() -> str:
     available_trackers = get_tracker_names()
 
     if env_tracker in available_trackers:
-        logger.debug(f"✅ Using tracker from environment: {env_tracker}")
+        logger.debug("✅ Using tracker from environment: %s", env_tracker)
         return env_tracker
     logger.warning(f"⚠️ Unknown tracker type in environment: {env_tracker}, available: {available_trackers}")
     # Prefer rfdetr as default, but allow other registered trackers
@@ -163,11 +213,11 @@ def get_tracker_type_from_env() -> str:
     return "dummy"
 
 
-# Registry for tracker classes (for custom trackers defined outside the module)
-TRACKER_REGISTRY: dict[str, type[VisionTracker]] = {
-    "dummy": DummyVisionTracker,
-    # "rfdetr" is imported dynamically to avoid dependency issues
-}
+# Read-only view of the tracker registry (for custom trackers defined outside the module).
+# Lazily registered trackers map to loader callables until resolved via tracker_registry.get().
+TRACKER_REGISTRY: Mapping[str, type[VisionTracker] | Callable[[], type[VisionTracker]]] = MappingProxyType(
+    tracker_registry._trackers
+)
 
 
 def register_tracker(name: str, tracker_class: type[VisionTracker]) -> None:
@@ -194,13 +244,12 @@ def register_tracker(name: str, tracker_class: type[VisionTracker]) -> None:
         >>> register_tracker("mycustom", MyCustomTracker)
         >>> # Now "mycustom" can be used as a tracker_type
     """
-    if not issubclass(tracker_class, VisionTracker):
-        raise TypeError(f"Tracker class {tracker_class.__name__} must inherit from VisionTracker")
+    _validate_tracker_cls(tracker_class)
 
     if name in TRACKER_REGISTRY:
         logger.warning(f"⚠️ Overriding existing tracker registration: {name}")
 
-    TRACKER_REGISTRY[name] = tracker_class
+    tracker_registry.register(name, tracker_class)
     logger.info(f"✅ Registered tracker: {name} -> {tracker_class.__name__}")
 
 
@@ -242,7 +291,8 @@ def get_available_trackers() -> list[str]:
     Get list of all available tracker types.
 
     Returns all tracker types that can be used to create tracker instances,
-    including both built-in and registered custom trackers.
+    including both built-in and registered custom trackers. The result is
+    cached until either registry changes, so callers must treat it as read-only.
 
     Returns:
         List of available tracker type strings
@@ -252,15 +302,25 @@ def get_available_trackers() -> list[str]:
         >>> print(trackers)
         ['dummy', 'rfdetr', 'mycustom']
     """
-    # Combine registered trackers with dynamically discovered ones
-    registry_trackers = list(TRACKER_REGISTRY.keys())
-    config_trackers = get_tracker_names()
+    return _compute_available_trackers(tracker_registry.version, get_tracker_config_version())
+
 
-    # Merge and deduplicate
-    all_trackers = list(set(registry_trackers + config_trackers))
-    all_trackers.sort()  # Sort for consistent ordering
+@lru_cache(maxsize=1)
+def _compute_available_trackers(registry_version: int, config_version: int) -> list[str]:  # noqa: ARG001
+    """
+    Merge registered tracker classes with registered tracker configs.
+
+    Args:
+        registry_version: Current tracker_registry version (part of the cache key)
+        config_version: Current tracker config registry version (part of the cache key)
 
-    logger.debug(f"📋 Available trackers: {all_trackers}")
+    Returns:
+        Sorted, deduplicated list of tracker type strings
+    """
+    # Combine registered trackers with dynamically discovered ones
+    all_trackers = sorted(set(TRACKER_REGISTRY).union(get_tracker_names()))
+
+    logger.debug(_LOG_AVAILABLE, all_trackers)
     return all_trackers
 
 
@@ -284,8 +344,7 @@ def unregister_tracker(name: str) -> bool:
         >>> unregister_tracker("nonexistent")
         False
     """
-    if name in TRACKER_REGISTRY:
-        del TRACKER_REGISTRY[name]
+    if tracker_registry.unregister(name):
         logger.info(f"🗑️ Unregistered tracker: {name}")
         return True
     logger.warning(f"⚠️ Attempted to unregister unknown tracker: {name}")
@@ -313,9 +372,25 @@ def get_tracker_info(tracker_type: str) -> dict[str, Any]:
         >>> print(info["class_name"])
         'RFDETRTracker'
     """
-    if tracker_type not in get_available_trackers():
+    if tracker_type not in TRACKER_REGISTRY and tracker_type not in get_tracker_names():
         raise ValueError(f"Unknown tracker type: {tracker_type}")
 
+    # Copy so callers can't mutate the cached entry
+    return dict(_compute_tracker_info(tracker_type, tracker_registry.version))
+
+
+@lru_cache(maxsize=128)
+def _compute_tracker_info(tracker_type: str, registry_version: int) -> dict[str, Any]:  # noqa: ARG001
+    """
+    Build the info dictionary for a known tracker type.
+
+    Args:
+        tracker_type: Name of the tracker to describe
+        registry_version: Current tracker_registry version (part of the cache key)
+
+    Returns:
+        Dictionary containing tracker information
+    """
     info = {
         "type": tracker_type,
         "available": True,
@@ -323,13 +398,7 @@ def get_tracker_info(tracker_type: str) -> dict[str, Any]:
     }
 
     if tracker_type in TRACKER_REGISTRY:
-        tracker_class = TRACKER_REGISTRY[tracker_type]
-        info.update(
-            {
-                "class_name": tracker_class.__name__,
-                "module": tracker_class.__module__,
-                "docstring": tracker_class.__doc__,
-            }
-        )
+        # Described from registration metadata, so lazily registered trackers are not imported
+        info.update(tracker_registry.describe(tracker_type))
 
     return info
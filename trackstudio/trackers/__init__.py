@@ -5,39 +5,107 @@ Dynamic registration system for vision trackers.
 """
 
 import logging
+from collections.abc import Callable
+from typing import Any
 
-from .base import BEVTrack, Detection, Track, VisionResult, VisionTracker
+from .base import BEVTrack, Detection, Track, VisionResult, VisionTracker, _validate_tracker_cls
 from .dummy import DummyVisionTracker as DummyTracker
-from .rfdetr import RFDETRTracker
 
 logger = logging.getLogger(__name__)
 
 
+def _load_rfdetr_tracker() -> type[VisionTracker]:
+    """Import RFDETRTracker on first use to avoid loading rfdetr/torch with the package"""
+    from .rfdetr import RFDETRTracker  # noqa: PLC0415
+
+    return RFDETRTracker
+
+
 class TrackerRegistry:
     """Registry for vision trackers"""
 
     def __init__(self):
-        self._trackers: dict[str, type[VisionTracker]] = {}
+        # Values are tracker classes, or loader callables for trackers that are imported lazily
+        self._trackers: dict[str, type[VisionTracker] | Callable[[], type[VisionTracker]]] = {}
+        # Class metadata for lazy registrations, so they can be described without importing them
+        self._lazy_info: dict[str, dict[str, str | None]] = {}
+        # Bumped on every registration change so callers can invalidate cached lookups
+        self.version = 0
         self._register_defaults()
 
     def _register_defaults(self):
         """Register default trackers"""
-        self.register("rfdetr", RFDETRTracker)
+        self.register_lazy(
+            "rfdetr",
+            _load_rfdetr_tracker,
+            class_name="RFDETRTracker",
+            module=f"{__name__}.rfdetr",
+            docstring="RF-DETR based vision tracker with DeepSORT tracking and TorchReID.",
+        )
         self.register("dummy", DummyTracker)
 
     def register(self, name: str, tracker_class: type[VisionTracker]):
         """Register a new tracker"""
-        if not issubclass(tracker_class, VisionTracker):
-            raise ValueError(f"{tracker_class} must inherit from VisionTracker")
+        _validate_tracker_cls(tracker_class)
 
         self._trackers[name] = tracker_class
+        self._lazy_info.pop(name, None)
+        self.version += 1
         logger.info(f"Registered tracker: {name}")
 
+    def register_lazy(
+        self,
+        name: str,
+        loader: Callable[[], type[VisionTracker]],
+        class_name: str,
+        module: str,
+        docstring: str | None = None,
+    ):
+        """
+        Register a tracker whose class is imported by calling loader on first use
+
+        class_name, module and docstring describe the class that loader returns, so
+        describe() can report it without triggering the import.
+        """
+        self._trackers[name] = loader
+        self._lazy_info[name] = {"class_name": class_name, "module": module, "docstring": docstring}
+        self.version += 1
+        logger.info(f"Registered tracker: {name} (lazy)")
+
+    def unregister(self, name: str) -> bool:
+        """Remove a tracker, returning False if it was not registered"""
+        if self._trackers.pop(name, None) is None:
+            return False
+        self._lazy_info.pop(name, None)
+
+        self.version += 1
+        logger.info(f"Unregistered tracker: {name}")
+        return True
+
     def get(self, name: str) -> type[VisionTracker]:
         """Get a tracker class by name"""
         if name not in self._trackers:
             raise ValueError(f"Unknown tracker: {name}. Available: {list(self._trackers.keys())}")
-        return self._trackers[name]
+
+        entry = self._trackers[name]
+        if isinstance(entry, type):
+            return entry
+
+        # Resolve a lazy registration once and memoize the class
+        tracker_class = entry()
+        _validate_tracker_cls(tracker_class)
+        self._trackers[name] = tracker_class
+        return tracker_class
+
+    def describe(self, name: str) -> dict[str, str | None]:
+        """Get the class name, module and docstring of a tracker without resolving lazy registrations"""
+        if name not in self._trackers:
+            raise ValueError(f"Unknown tracker: {name}. Available: {list(self._trackers.keys())}")
+
+        entry = self._trackers[name]
+        if isinstance(entry, type):
+            return {"class_name": entry.__name__, "module": entry.__module__, "docstring": entry.__doc__}
+        return dict(self._lazy_info[name])
 
     def create(self, name: str, **kwargs) -> VisionTracker:
         """Create a tracker instance"""
@@ -52,6 +120,16 @@ class TrackerRegistry:
 # Global registry instance
 tracker_registry = TrackerRegistry()
 
+
+def __getattr__(name: str) -> Any:
+    """Lazily import heavy tracker implementations on first attribute access"""
+    if name == "RFDETRTracker":
+        tracker_class = _load_rfdetr_tracker()
+        globals()["RFDETRTracker"] = tracker_class
+        return tracker_class
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Export commonly used items
 __all__ = [
     "VisionTracker",
@@ -7,6 +7,7 @@ A tracker handles detection, single-camera tracking, and BEV transformation for
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from functools import cache
 from typing import Any
 
 import numpy as np
@@ -15,7 +16,7 @@ from pydantic import BaseModel
 from ..calibration import CameraCalibration
 
 
-@dataclass
+@dataclass(slots=True)
 class Detection:
     """
     Single detection result from object detection.
@@ -36,7 +37,7 @@ class Detection:
     class_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class Track:
     """
     Single tracking result for an object across frames.
@@ -59,7 +60,7 @@ class Track:
     camera_id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class BEVTrack:
     """
     Bird's Eye View tracking result.
@@ -86,7 +87,7 @@ class BEVTrack:
     trajectory: list[tuple[float, float, float]] | None = None  # List of (x, y, timestamp) for recent positions
 
 
-@dataclass
+@dataclass(slots=True)
 class VisionResult:
     """
     Complete vision processing result for all camera streams.
@@ -178,6 +179,24 @@ class VisionTracker(ABC):
         """
         pass
 
+    def detect_batch(self, frames: dict[int, np.ndarray]) -> dict[int, list[Detection]]:
+        """
+        Detect objects in one frame from each of several cameras.
+
+        The default implementation calls detect() once per camera. Trackers whose
+        models benefit from batching can override this to run a single forward pass.
+
+        Args:
+            frames: Input images in BGR format keyed by camera ID
+
+        Returns:
+            Detections keyed by camera ID, in the same order as frames
+
+        Raises:
+            RuntimeError: If the detection model is not properly initialized
+        """
+        return {camera_id: self.detect(frame, camera_id=camera_id) for camera_id, frame in frames.items()}
+
     @abstractmethod
     def track(
         self, detections: list[Detection], camera_id: int, timestamp: float, frame: np.ndarray | None = None
@@ -202,6 +221,31 @@ class VisionTracker(ABC):
         """
         pass
 
+    def track_batch(
+        self, detections: dict[int, list[Detection]], frames: dict[int, np.ndarray], timestamp: float
+    ) -> dict[int, list[Track]]:
+        """
+        Track objects for several cameras at the same timestamp.
+
+        The default implementation calls track() once per camera. Trackers that keep
+        independent per-camera state can override this to update cameras concurrently.
+
+        Args:
+            detections: Detections from the current frame keyed by camera ID
+            frames: Original frames keyed by camera ID
+            timestamp: Timestamp of the current frame in seconds
+
+        Returns:
+            Tracks keyed by camera ID, in the same order as frames
+
+        Raises:
+            ValueError: If required parameters are missing or invalid
+        """
+        return {
+            camera_id: self.track(detections.get(camera_id, []), camera_id=camera_id, timestamp=timestamp, frame=frame)
+            for camera_id, frame in frames.items()
+        }
+
     @abstractmethod
     def transform_to_bev(self, tracks: list[Track]) -> list[BEVTrack]:
         """
@@ -269,6 +313,8 @@ class VisionTracker(ABC):
 
         This is an optional method that can be implemented to extract
         appearance features for person re-identification across cameras.
+        Features are compared by cosine similarity and should be L2-normalized
+        (unit length) per track; the BEV merger re-normalizes them defensively.
 
         Args:
             frame: Input frame containing the tracked objects
@@ -281,3 +327,42 @@ class VisionTracker(ABC):
             RuntimeError: If the ReID model fails to extract features
         """
         return None
+
+    def get_reid_features_multi(
+        self, frames: dict[int, np.ndarray], tracks: dict[int, list[Track]]
+    ) -> dict[int, np.ndarray | None]:
+        """
+        Extract ReID features for the tracks of several cameras.
+
+        The default implementation calls get_reid_features() once per camera. Trackers
+        can override this to run one batched forward pass across all cameras.
+
+        Args:
+            frames: Frames containing the tracked objects keyed by camera ID
+            tracks: Tracks to extract features for keyed by camera ID
+
+        Returns:
+            Features per camera with one row per track, or None where not supported
+        """
+        return {
+            camera_id: self.get_reid_features(frame, tracks[camera_id])
+            for camera_id, frame in frames.items()
+            if camera_id in tracks
+        }
+
+
+@cache
+def _validate_tracker_cls(tracker_class: type) -> None:
+    """
+    Check that a tracker class implements the VisionTracker interface.
+
+    Class inheritance does not change at runtime, so the check runs once per class.
+
+    Args:
+        tracker_class: Class to validate
+
+    Raises:
+        TypeError: If the tracker class doesn't inherit from VisionTracker
+    """
+    if not issubclass(tracker_class, VisionTracker):
+        raise TypeError(f"Tracker class {tracker_class.__name__} must inherit from VisionTracker")
@@ -7,6 +7,7 @@ object detection or tracking algorithms.
 """
 
 import logging
+from collections import defaultdict
 from typing import Any
 
 import numpy as np
@@ -15,6 +16,12 @@ from .base import BaseTrackerConfig, BEVTrack, Detection, Track, VisionTracker
 
 logger = logging.getLogger(__name__)
 
+# Shared random generator for dummy detections
+_rng = np.random.default_rng()
+
+# Shared default config, the dummy tracker never reads or mutates it
+_DEFAULT_DUMMY_CONFIG = BaseTrackerConfig()
+
 
 class DummyVisionTracker(VisionTracker):
     """
@@ -33,7 +40,7 @@ class DummyVisionTracker(VisionTracker):
             config: Optional configuration object (unused by dummy tracker)
             calibration_file: Optional path to calibration data file
         """
-        super().__init__(config or BaseTrackerConfig(), calibration_file)
+        super().__init__(config if config is not None else _DEFAULT_DUMMY_CONFIG, calibration_file)
         logger.info("🤖 DummyVisionTracker initialized with dummy detection/tracking")
 
     def get_config_schema(self) -> dict[str, Any]:
@@ -69,29 +76,21 @@ class DummyVisionTracker(VisionTracker):
         Returns:
             List of randomly generated Detection objects
         """
-        detections = []
-
-        # Generate 1-3 random detections per frame
-        num_detections = np.random.randint(0, 4)
+        # Generate 0-3 random detections per frame
+        num_detections = int(_rng.integers(0, 4))
+        if num_detections == 0:
+            return []
 
         h, w = frame.shape[:2]
 
-        for _i in range(num_detections):
-            # Random bounding box
-            x = np.random.randint(0, w - 100)
-            y = np.random.randint(0, h - 100)
-            width = np.random.randint(50, 150)
-            height = np.random.randint(80, 200)
-
-            detection = Detection(
-                bbox=(x, y, width, height),
-                confidence=0.7 + np.random.random() * 0.3,  # 0.7-1.0
-                class_name="person",
-                class_id=0,
-            )
-            detections.append(detection)
+        # Random (x, y, width, height) bounding boxes and confidences (0.7-1.0) in one batch
+        boxes = _rng.integers(low=[0, 0, 50, 80], high=[w - 100, h - 100, 150, 200], size=(num_detections, 4))
+        confidences = 0.7 + _rng.random(num_detections) * 0.3
 
-        return detections
+        return [
+            Detection(bbox=tuple(bbox), confidence=confidence, class_name="person", class_id=0)
+            for bbox, confidence in zip(boxes.tolist(), confidences.tolist(), strict=True)
+        ]
 
     def track(
         self, detections: list[Detection], camera_id: int, timestamp: float, frame: np.ndarray | None = None
@@ -111,21 +110,20 @@ class DummyVisionTracker(VisionTracker):
         Returns:
             List of Track objects with simple IDs
         """
-        tracks = []
+        # Camera and timestamp are fixed for the call; only the detection index varies
+        prefix = f"cam{camera_id}_track_"
+        suffix = f"_{int(timestamp)}"
 
-        for i, detection in enumerate(detections):
-            track_id = f"cam{camera_id}_track_{i}_{int(timestamp)}"
-
-            track = Track(
-                track_id=track_id,
+        return [
+            Track(
+                track_id=f"{prefix}{i}{suffix}",
                 bbox=detection.bbox,
                 confidence=detection.confidence,
                 age=1,  # Dummy age
                 camera_id=camera_id,
             )
-            tracks.append(track)
-
-        return tracks
+            for i, detection in enumerate(detections)
+        ]
 
     def transform_to_bev(self, tracks: list[Track]) -> list[BEVTrack]:
         """
@@ -140,45 +138,75 @@ class DummyVisionTracker(VisionTracker):
         Returns:
             List of BEVTrack objects in bird's eye view coordinates
         """
-        bev_tracks = []
+        bev_tracks = [
+            BEVTrack(
+                track_id=track.track_id,
+                bev_x=bev_point[0],
+                bev_y=bev_point[1],
+                confidence=track.confidence,
+                camera_id=track.camera_id,
+            )
+            for track, bev_point in zip(tracks, self._transform_feet_points(tracks), strict=True)
+            if bev_point is not None
+        ]
 
-        # Debug logging for multi-camera BEV transformation
-        camera_track_counts: dict[int, int] = {}
-        for track in tracks:
-            camera_track_counts[track.camera_id] = camera_track_counts.get(track.camera_id, 0) + 1
-        logger.debug(f"🗺️ BEV Transform input: {camera_track_counts} tracks per camera")
+        logger.debug("🗺️ BEV Transform output: %d total BEV tracks", len(bev_tracks))
+        return bev_tracks
 
-        for track in tracks:
-            # Use bottom center of bounding box (feet position)
+    def _transform_feet_points(self, tracks: list[Track]) -> list[tuple[float, float] | None]:
+        """
+        Transform the feet position of each track to BEV pixels.
+
+        Args:
+            tracks: List of tracks in camera coordinates
+
+        Returns:
+            BEV (x, y) per track in input order, or None where the camera has no homography
+        """
+        # Debug logging for multi-camera BEV transformation
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
+            camera_track_counts: dict[int, int] = {}
+            for track in tracks:
+                camera_track_counts[track.camera_id] = camera_track_counts.get(track.camera_id, 0) + 1
+            logger.debug("🗺️ BEV Transform input: %s tracks per camera", camera_track_counts)
+
+        # Group feet positions (bottom center of the bounding box) by camera
+        camera_feet: dict[int, list[tuple[int, int]]] = defaultdict(list)
+        camera_indices: dict[int, list[int]] = defaultdict(list)
+        for i, track in enumerate(tracks):
             x, y, w, h = track.bbox
-            feet_x = x + w // 2
-            feet_y = y + h
+            camera_feet[track.camera_id].append((x + w // 2, y + h))
+            camera_indices[track.camera_id].append(i)
 
+        # One homography call per camera, scattered back into track order
+        transform_points_to_bev = self.calibration.transform_points_to_bev
+        bev_points: list[tuple[float, float] | None] = [None] * len(tracks)
+        for camera_id, feet_points in camera_feet.items():
             # Use BEV pixels directly instead of converting to meters
-            transformed_points = self.calibration.transform_points_to_bev([(feet_x, feet_y)], track.camera_id)
+            transformed_points = transform_points_to_bev(feet_points, camera_id)
 
             if not transformed_points:
-                logger.debug(f"❌ Camera {track.camera_id} track {track.track_id}: No homography matrix available")
+                logger.debug("❌ Camera %s: No homography matrix available for %d tracks", camera_id, len(feet_points))
                 continue
 
-            bev_x_pixels, bev_y_pixels = transformed_points[0]
-
-            logger.debug(
-                f"🗺️ Camera {track.camera_id} track {track.track_id}: "
-                f"feet({feet_x},{feet_y}) -> BEV({bev_x_pixels:.1f},{bev_y_pixels:.1f})"
-            )
-
-            bev_track = BEVTrack(
-                track_id=track.track_id,
-                bev_x=bev_x_pixels,
-                bev_y=bev_y_pixels,
-                confidence=track.confidence,
-                camera_id=track.camera_id,
-            )
-            bev_tracks.append(bev_track)
-
-        logger.debug(f"🗺️ BEV Transform output: {len(bev_tracks)} total BEV tracks")
-        return bev_tracks
+            for i, (feet_x, feet_y), (bev_x_pixels, bev_y_pixels) in zip(
+                camera_indices[camera_id], feet_points, transformed_points, strict=True
+            ):
+                if debug_enabled:
+                    logger.debug(
+                        "🗺️ Camera %s track %s: feet(%s,%s) -> BEV(%.1f,%.1f)",
+                        camera_id,
+                        tracks[i].track_id,
+                        feet_x,
+                        feet_y,
+                        bev_x_pixels,
+                        bev_y_pixels,
+                    )
+
+                bev_points[i] = (bev_x_pixels, bev_y_pixels)
+
+        return bev_points
 
     def get_statistics(self) -> dict[str, Any]:
         """
@@ -6,22 +6,80 @@ from Roboflow, with DeepSORT tracking and TorchReID features.
 """
 
 import logging
-from typing import Any
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import cache
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 import supervision as sv
-from rfdetr.detr import RFDETRBase, RFDETRLarge
+import torch
+from torchvision.ops import nms
+from torchvision.transforms.functional import normalize as tv_normalize
+from torchvision.transforms.functional import resize as tv_resize
 
 from ..models.reid_extractor import TorchReIDExtractor
-from ..vision_config import RFDETRTrackerConfig
+from ..vision_config import RFDETRTrackerConfig, SingleCameraTrackerConfig
 from .base import BEVTrack, Detection, Track, VisionTracker
 
+if TYPE_CHECKING:
+    from rfdetr.detr import RFDETRBase, RFDETRLarge
+
 logger = logging.getLogger(__name__)
 
-# Import DeepSORT - FAIL if not available (no fallbacks)
-from trackers import DeepSORTTracker
+# Score threshold applied by RFDETRBase.predict() when none is passed
+_PREDICT_THRESHOLD = 0.5
+
+# Forward passes run after torch.compile so compilation happens at startup rather than on the first frame
+_COMPILE_WARMUP_ITERS = 3
+
+# Forward passes run before capturing the CUDA graph, so lazy CUDA initialization happens outside the capture
+_CUDA_GRAPH_WARMUP_ITERS = 3
+
+
+@cache
+def _rfdetr_model_classes() -> tuple[type["RFDETRBase"], type["RFDETRLarge"]]:
+    """Import the RF-DETR model classes on first use"""
+    from rfdetr.detr import RFDETRBase, RFDETRLarge  # noqa: PLC0415
+
+    return RFDETRBase, RFDETRLarge
 
-logger.info("✅ Using DeepSORTTracker from trackers package")
+
+@cache
+def _deepsort_tracker_class() -> type:
+    """Import DeepSORTTracker on first use - FAIL if not available (no fallbacks)"""
+    from trackers import DeepSORTTracker  # noqa: PLC0415
+
+    logger.info("✅ Using DeepSORTTracker from trackers package")
+    return DeepSORTTracker
+
+
+def _tracking_config_applier(tracker: Any) -> Callable[[SingleCameraTrackerConfig], None]:
+    """
+    Build a function that applies live-updatable tracking parameters to a DeepSORT tracker.
+
+    The tracker is probed for the supported attributes once, here, instead of on every update.
+
+    Args:
+        tracker: DeepSORT tracker instance
+
+    Returns:
+        Function taking the tracking config and updating the tracker in place
+    """
+    has_max_age = hasattr(tracker, "max_age")
+    has_min_hits = hasattr(tracker, "min_hits")
+    metric_params = getattr(getattr(tracker, "_metric", None), "_metric_params", None)
+
+    def apply(tracking_config: SingleCameraTrackerConfig) -> None:
+        if has_max_age:
+            tracker.max_age = tracking_config.tracker_max_age
+        if has_min_hits:
+            tracker.min_hits = tracking_config.tracker_min_hits
+        if metric_params is not None:
+            metric_params["matching_threshold"] = tracking_config.tracker_matching_threshold
+
+    return apply
 
 
 class RFDETRTracker(VisionTracker):
@@ -46,24 +104,59 @@ class RFDETRTracker(VisionTracker):
         model_name: str = "RFDETRBase",
         reid_model: str = "osnet_x1_0",
         calibration_file: str | None = None,
+        optimize_for_inference: bool = True,
+        half_precision: bool = True,
+        compile_model: bool = True,
+        use_cuda_graph: bool = True,
+        parallel_tracking: bool = False,
     ) -> None:
         """
         Initialize the RF-DETR tracker.
 
+        The detector switches are fixed at construction; the live-updatable parameters
+        are in config.
+
         Args:
             config: Configuration object for the tracker
             model_name: Name of the RF-DETR model ("RFDETRBase" or "RFDETRLarge")
             reid_model: Name of the ReID model for appearance features
             calibration_file: Optional path to calibration data file
+            optimize_for_inference: Export an inference-only copy of the RF-DETR model for lower latency
+            half_precision: Run the optimized model in FP16 (CUDA with an optimized model only)
+            compile_model: Compile the optimized model with torch.compile (CUDA with an optimized model only)
+            use_cuda_graph: Replay a captured CUDA graph for the forward pass (CUDA with an optimized model only)
+            parallel_tracking: Update each camera's DeepSORT tracker in its own worker thread
         """
         super().__init__(config, calibration_file)
         self.config: RFDETRTrackerConfig = config
         self.model_name = model_name
         self.reid_model = reid_model
+        self.optimize_for_inference = optimize_for_inference
+        self.half_precision = half_precision
+        self.compile_model = compile_model
+        self.parallel_tracking = parallel_tracking
 
         self.model: RFDETRBase | RFDETRLarge | None = None
         self.reid_extractor: TorchReIDExtractor | None = None
         self.trackers: dict[int, Any] = {}
+        self._tracker_config_appliers: dict[int, Callable[[SingleCameraTrackerConfig], None]] = {}
+        self._track_executor: ThreadPoolExecutor | None = None
+        self._track_workers = 0
+
+        # CUDA graph replay state for the single-frame forward pass, captured on first use
+        self._cuda_graph: torch.cuda.CUDAGraph | None = None
+        self._graph_input: torch.Tensor | None = None
+        self._graph_output: Any = None
+        self._graph_disabled = not use_cuda_graph
+
+        # Page-locked staging buffers for frame uploads, one per camera
+        self._pinned_frames: dict[int, torch.Tensor] = {}
+
+        # Last uploaded frame per camera as (host frame, uint8 device tensor), reused by DeepSORT and ReID
+        self._device_frames: dict[int, tuple[np.ndarray, torch.Tensor]] = {}
+
+        # Resolve DeepSORT up front so a missing package fails at construction, not on the first frame
+        _deepsort_tracker_class()
 
         self._initialize_detector()
         self._initialize_reid()
@@ -85,13 +178,8 @@ class RFDETRTracker(VisionTracker):
         self.config = RFDETRTrackerConfig(**new_config_data)
 
         # Update live-updatable tracker parameters
-        for tracker in self.trackers.values():
-            if hasattr(tracker, "max_age"):
-                tracker.max_age = self.config.tracking.tracker_max_age
-            if hasattr(tracker, "min_hits"):
-                tracker.min_hits = self.config.tracking.tracker_min_hits
-            if hasattr(tracker, "_metric") and hasattr(tracker._metric, "_metric_params"):
-                tracker._metric._metric_params["matching_threshold"] = self.config.tracking.tracker_matching_threshold
+        for apply_tracking_config in self._tracker_config_appliers.values():
+            apply_tracking_config(self.config.tracking)
 
     def _initialize_detector(self) -> None:
         """
@@ -99,12 +187,222 @@ class RFDETRTracker(VisionTracker):
 
         Creates the appropriate RF-DETR model based on the model_name parameter.
         """
+        rfdetr_base, rfdetr_large = _rfdetr_model_classes()
         if self.model_name == "RFDETRBase":
-            self.model = RFDETRBase(resolution=560)
+            self.model = rfdetr_base(resolution=560)
         elif self.model_name == "RFDETRLarge":
-            self.model = RFDETRLarge(resolution=560)
+            self.model = rfdetr_large(resolution=560)
         else:
-            self.model = RFDETRBase(pretrain_weights=self.model_name)
+            self.model = rfdetr_base(pretrain_weights=self.model_name)
+
+        if self.optimize_for_inference:
+            self._optimize_detector()
+
+    def _optimize_detector(self) -> None:
+        """
+        Switch RF-DETR to its exported inference-only model.
+
+        The model is not traced (compile=False): a traced model is fixed to one batch
+        size, while the number of frames per predict call varies with active cameras.
+        On CUDA the exported copy runs in FP16 unless half_precision is disabled.
+        """
+        if self.model is None:
+            return
+
+        use_half = self.half_precision and self.model.model.device.type == "cuda"
+        dtype = torch.float16 if use_half else torch.float32
+        try:
+            self.model.optimize_for_inference(compile=False, dtype=dtype)
+            logger.info(f"⚡ RF-DETR model optimized for inference ({dtype})")
+        except Exception as e:
+            logger.warning(f"⚠️ RF-DETR inference optimization failed, using the unoptimized model: {e}")
+            self.model.remove_optimized_model()
+            return
+
+        if self.compile_model and self.model.model.device.type == "cuda":
+            self._compile_detector()
+
+    def _compile_detector(self) -> None:
+        """
+        Compile the exported RF-DETR model with torch.compile and warm it up.
+
+        Compilation is lazy, so a few single-frame forward passes run here to pay its
+        cost before the first real frame. Other batch sizes compile on first use. If
+        compilation fails the exported eager model is kept.
+        """
+        detector = self.model.model
+        resolution = detector.resolution
+        dtype = getattr(self.model, "_optimized_dtype", torch.float32)
+        try:
+            compiled_model = torch.compile(detector.inference_model, dynamic=False)
+            dummy_input = torch.zeros((1, 3, resolution, resolution), device=detector.device, dtype=dtype)
+            with torch.inference_mode():
+                for _ in range(_COMPILE_WARMUP_ITERS):
+                    compiled_model(dummy_input)
+        except Exception as e:
+            logger.warning(f"⚠️ RF-DETR torch.compile failed, using the eager model: {e}")
+            return
+
+        detector.inference_model = compiled_model
+        logger.info("⚡ RF-DETR model compiled with torch.compile")
+
+    def _capture_cuda_graph(self) -> bool:
+        """
+        Capture the optimized RF-DETR forward pass as a CUDA graph.
+
+        Requires a CUDA device and a model prepared with optimize_for_inference(). On any
+        failure graph replay is disabled for the lifetime of the tracker.
+
+        Returns:
+            True if a graph is ready for replay
+        """
+        detector = self.model.model if self.model is not None else None
+        inference_model = getattr(detector, "inference_model", None)
+        if inference_model is None or detector.device.type != "cuda":
+            self._graph_disabled = True
+            return False
+
+        resolution = detector.resolution
+        dtype = getattr(self.model, "_optimized_dtype", torch.float32)
+        try:
+            static_input = torch.zeros((1, 3, resolution, resolution), device=detector.device, dtype=dtype)
+
+            # Warm up on a side stream, as required before capture
+            side_stream = torch.cuda.Stream(device=detector.device)
+            side_stream.wait_stream(torch.cuda.current_stream(detector.device))
+            with torch.cuda.stream(side_stream), torch.inference_mode():
+                for _ in range(_CUDA_GRAPH_WARMUP_ITERS):
+                    inference_model(static_input)
+            torch.cuda.current_stream(detector.device).wait_stream(side_stream)
+
+            graph = torch.cuda.CUDAGraph()
+            with torch.inference_mode(), torch.cuda.graph(graph):
+                static_output = inference_model(static_input)
+        except Exception as e:
+            logger.warning(f"⚠️ CUDA graph capture failed, using regular RF-DETR inference: {e}")
+            self._graph_disabled = True
+            return False
+
+        self._cuda_graph = graph
+        self._graph_input = static_input
+        self._graph_output = static_output
+        logger.info(f"⚡ Captured CUDA graph for RF-DETR inference at {resolution}x{resolution}")
+        return True
+
+    def _upload_frame(self, frame: np.ndarray, camera_id: int) -> torch.Tensor | None:
+        """
+        Copy a frame to the detector's GPU through a reusable pinned-memory buffer.
+
+        The uint8 frame is uploaded as-is and converted to float on the device, which
+        moves a quarter of the bytes predict() would send for a float32 CPU tensor.
+
+        Args:
+            frame: Input image frame (H, W, 3) in uint8
+            camera_id: ID of the camera whose staging buffer to use
+
+        The uint8 device copy is kept per camera so tracking and ReID can crop from it
+        instead of uploading the same frame again (see _device_frame()).
+
+        Returns:
+            Image tensor (3, H, W) in [0, 1] on the detector device, or None if the
+            detector does not run on CUDA and the frame should be passed unchanged
+        """
+        device = self.model.model.device
+        if device.type != "cuda" or frame.dtype != np.uint8:
+            return None
+
+        pinned = self._pinned_frames.get(camera_id)
+        if pinned is None or pinned.shape != frame.shape:
+            pinned = torch.empty(frame.shape, dtype=torch.uint8, pin_memory=True)
+            self._pinned_frames[camera_id] = pinned
+        pinned.numpy()[...] = frame
+
+        # Detection results are read back on the CPU before the next upload from this
+        # camera, so the buffer is never overwritten while a copy is still in flight
+        device_frame = pinned.to(device, non_blocking=True)
+        self._device_frames[camera_id] = (frame, device_frame)
+        return device_frame.permute(2, 0, 1).float().div_(255.0)
+
+    def _device_frame(self, frame: np.ndarray, camera_id: int) -> np.ndarray | torch.Tensor:
+        """
+        Return the device copy of a frame uploaded by detect(), or the frame itself.
+
+        Args:
+            frame: Input image frame
+            camera_id: ID of the source camera
+
+        Returns:
+            uint8 device tensor (H, W, 3) if this exact frame was uploaded for detection,
+            otherwise the unchanged frame
+        """
+        cached = self._device_frames.get(camera_id)
+        if cached is not None and cached[0] is frame:
+            return cached[1]
+        return frame
+
+    def _graphed_predict(self, frame: np.ndarray, camera_id: int) -> sv.Detections | None:
+        """
+        Run RF-DETR on a single frame by replaying the captured CUDA graph.
+
+        Preprocessing and postprocessing match RFDETRBase.predict(); only the forward
+        pass is replayed, on a fixed resolution x resolution input.
+
+        Args:
+            frame: Input image frame
+            camera_id: ID of the source camera
+
+        Returns:
+            Detections for the frame, or None if graph replay is unavailable and the
+            caller should fall back to predict()
+        """
+        if self._graph_disabled or (self._cuda_graph is None and not self._capture_cuda_graph()):
+            return None
+
+        detector = self.model.model
+        height, width = frame.shape[:2]
+        try:
+            with torch.inference_mode():
+                image = self._upload_frame(frame, camera_id)
+                if image is None:
+                    return None
+                image = tv_normalize(image, self.model.means, self.model.stds)
+                image = tv_resize(image, [detector.resolution, detector.resolution])
+                self._graph_input.copy_(image.unsqueeze(0))
+
+                self._cuda_graph.replay()
+
+                predictions = self._graph_output
+                if isinstance(predictions, tuple):
+                    predictions = {"pred_logits": predictions[1], "pred_boxes": predictions[0]}
+                target_sizes = torch.tensor([[height, width]], device=detector.device)
+                result = detector.postprocessors["bbox"](predictions, target_sizes=target_sizes)[0]
+        except Exception as e:
+            logger.warning(f"⚠️ CUDA graph replay failed, using regular RF-DETR inference: {e}")
+            self._graph_disabled = True
+            self._cuda_graph = None
+            return None
+
+        keep = result["scores"] > _PREDICT_THRESHOLD
+        return sv.Detections(
+            xyxy=result["boxes"][keep].float().cpu().numpy(),
+            confidence=result["scores"][keep].float().cpu().numpy(),
+            class_id=result["labels"][keep].cpu().numpy(),
+        )
+
+    def _prepare_input(self, frame: np.ndarray, camera_id: int) -> np.ndarray | torch.Tensor:
+        """
+        Prepare a frame for RFDETRBase.predict(), uploading it through pinned memory when possible.
+
+        Args:
+            frame: Input image frame
+            camera_id: ID of the source camera
+
+        Returns:
+            Device tensor accepted by predict(), or the unchanged frame
+        """
+        with torch.inference_mode():
+            image = self._upload_frame(frame, camera_id)
+        return frame if image is None else image
 
     def _initialize_reid(self) -> None:
         """
@@ -137,15 +435,12 @@ class RFDETRTracker(VisionTracker):
                 raise RuntimeError("ReID extractor not initialized.")
 
             # Use TorchReIDExtractor directly - DeepSORT will call it with supervision.Detections
-            self.trackers[camera_id] = DeepSORTTracker(feature_extractor=self.reid_extractor)
+            tracker = _deepsort_tracker_class()(feature_extractor=self.reid_extractor)
+            apply_tracking_config = _tracking_config_applier(tracker)
+            apply_tracking_config(self.config.tracking)
 
-            tracker = self.trackers[camera_id]
-            if hasattr(tracker, "max_age"):
-                tracker.max_age = self.config.tracking.tracker_max_age
-            if hasattr(tracker, "min_hits"):
-                tracker.min_hits = self.config.tracking.tracker_min_hits
-            if hasattr(tracker, "_metric") and hasattr(tracker._metric, "_metric_params"):
-                tracker._metric._metric_params["matching_threshold"] = self.config.tracking.tracker_matching_threshold
+            self.trackers[camera_id] = tracker
+            self._tracker_config_appliers[camera_id] = apply_tracking_config
 
         return self.trackers[camera_id]
 
@@ -166,36 +461,83 @@ class RFDETRTracker(VisionTracker):
         if self.model is None:
             raise RuntimeError("RF-DETR model not initialized.")
 
-        sv_detections = self.model.predict(frame)
-        person_detections = []
-
-        if hasattr(sv_detections, "class_id") and sv_detections.class_id is not None:
-            for i in range(len(sv_detections)):
-                if sv_detections.class_id[i] == 1:  # Person class
-                    if sv_detections.confidence[i] < self.config.detection.confidence_threshold:
-                        continue
-
-                    x1, y1, x2, y2 = sv_detections.xyxy[i]
-                    w, h = x2 - x1, y2 - y1
-
-                    if (
-                        w < self.config.detection.min_box_width
-                        or h < self.config.detection.min_box_height
-                        or (h > 0 and w / h > self.config.detection.max_aspect_ratio)
-                    ):
-                        continue
-
-                    person_detections.append(
-                        Detection(
-                            bbox=(int(x1), int(y1), int(w), int(h)),
-                            confidence=float(sv_detections.confidence[i]),
-                            class_name="person",
-                            class_id=1,
-                        )
-                    )
+        sv_detections = self._graphed_predict(frame, camera_id)
+        if sv_detections is None:
+            sv_detections = self.model.predict(self._prepare_input(frame, camera_id))
+
+        return self._filter_person_detections(sv_detections)
+
+    def detect_batch(self, frames: dict[int, np.ndarray]) -> dict[int, list[Detection]]:
+        """
+        Detect objects in frames from several cameras with one batched RF-DETR forward pass.
+
+        Args:
+            frames: Input image frames keyed by camera ID
+
+        Returns:
+            Detections keyed by camera ID (filtered for persons only)
+
+        Raises:
+            RuntimeError: If RF-DETR model is not initialized
+        """
+        if len(frames) <= 1:
+            # Single frames go through detect() and its CUDA graph path
+            return super().detect_batch(frames)
+
+        if self.model is None:
+            raise RuntimeError("RF-DETR model not initialized.")
+
+        # predict() returns one sv.Detections per image when given a list
+        batch_detections = self.model.predict(
+            [self._prepare_input(frame, camera_id) for camera_id, frame in frames.items()]
+        )
+        return {
+            camera_id: self._filter_person_detections(sv_detections)
+            for camera_id, sv_detections in zip(frames, batch_detections, strict=True)
+        }
+
+    def _filter_person_detections(self, sv_detections: sv.Detections) -> list[Detection]:
+        """
+        Convert RF-DETR output to person detections that pass the configured filters.
+
+        Args:
+            sv_detections: Raw RF-DETR detections for one frame
+
+        Returns:
+            List of person detections
+        """
+        if getattr(sv_detections, "class_id", None) is None or len(sv_detections) == 0:
+            return []
+
+        # Read each threshold once per frame rather than through the config chain per use
+        detection_config = self.config.detection
+        confidence_threshold = detection_config.confidence_threshold
+        min_box_width = detection_config.min_box_width
+        min_box_height = detection_config.min_box_height
+        max_aspect_ratio = detection_config.max_aspect_ratio
+
+        xyxy = sv_detections.xyxy
+        confidence = sv_detections.confidence
+        widths = xyxy[:, 2] - xyxy[:, 0]
+        heights = xyxy[:, 3] - xyxy[:, 1]
+
+        # Person class with enough confidence, a minimum size and a bounded aspect ratio (w/h)
+        keep = (
+            (sv_detections.class_id == 1)
+            & (confidence >= confidence_threshold)
+            & (widths >= min_box_width)
+            & (heights >= min_box_height)
+            & ((heights <= 0) | (widths <= max_aspect_ratio * heights))
+        )
+
+        boxes = np.column_stack((xyxy[keep, 0], xyxy[keep, 1], widths[keep], heights[keep])).astype(np.int64)
+        person_detections = [
+            Detection(bbox=tuple(bbox), confidence=score, class_name="person", class_id=1)
+            for bbox, score in zip(boxes.tolist(), confidence[keep].tolist(), strict=True)
+        ]
 
         if len(person_detections) > 1:
-            return self._apply_nms(person_detections, self.config.detection.nms_iou_threshold)
+            return self._apply_nms(person_detections, detection_config.nms_iou_threshold)
 
         return person_detections
 
@@ -223,16 +565,21 @@ class RFDETRTracker(VisionTracker):
         tracker = self._get_or_create_tracker(camera_id)
 
         if not detections:
-            tracker.update(sv.Detections.empty(), frame)
+            tracker.update(sv.Detections.empty(), self._device_frame(frame, camera_id))
             return []
 
+        # Gather all fields in one pass, then convert (x, y, w, h) to (x1, y1, x2, y2) in place
+        bboxes, confidences, class_ids = zip(*((d.bbox, d.confidence, d.class_id) for d in detections), strict=True)
+        xyxy = np.array(bboxes, dtype=np.float32)
+        xyxy[:, 2:] += xyxy[:, :2]
         sv_detections = sv.Detections(
-            xyxy=np.array([[d.bbox[0], d.bbox[1], d.bbox[0] + d.bbox[2], d.bbox[1] + d.bbox[3]] for d in detections]),
-            confidence=np.array([d.confidence for d in detections]),
-            class_id=np.array([d.class_id for d in detections]),
+            xyxy=xyxy,
+            confidence=np.array(confidences, dtype=np.float32),
+            class_id=np.array(class_ids, dtype=np.int64),
         )
 
-        tracked_detections = tracker.update(sv_detections, frame)
+        # DeepSORT only hands the frame to the ReID extractor, which accepts the device copy
+        tracked_detections = tracker.update(sv_detections, self._device_frame(frame, camera_id))
 
         tracks = []
         if hasattr(tracked_detections, "tracker_id") and tracked_detections.tracker_id is not None:
@@ -250,6 +597,44 @@ class RFDETRTracker(VisionTracker):
                     )
         return tracks
 
+    def track_batch(
+        self, detections: dict[int, list[Detection]], frames: dict[int, np.ndarray], timestamp: float
+    ) -> dict[int, list[Track]]:
+        """
+        Track objects for several cameras, updating each camera's DeepSORT tracker in a worker thread.
+
+        Each camera has its own DeepSORT state, and the heavy work (ReID inference and
+        NumPy matching) releases the GIL, so per-camera updates can overlap.
+
+        Args:
+            detections: Detections from the current frame keyed by camera ID
+            frames: Original frames keyed by camera ID
+            timestamp: Current frame timestamp
+
+        Returns:
+            Tracks keyed by camera ID
+        """
+        if len(frames) <= 1 or not self.parallel_tracking:
+            return super().track_batch(detections, frames, timestamp)
+
+        # Create missing trackers up front so worker threads never mutate self.trackers
+        for camera_id in frames:
+            self._get_or_create_tracker(camera_id)
+
+        if self._track_executor is None or self._track_workers < len(frames):
+            if self._track_executor is not None:
+                self._track_executor.shutdown(wait=False)
+            self._track_workers = len(frames)
+            self._track_executor = ThreadPoolExecutor(max_workers=self._track_workers, thread_name_prefix="deepsort")
+
+        futures = {
+            camera_id: self._track_executor.submit(
+                self.track, detections.get(camera_id, []), camera_id, timestamp, frame
+            )
+            for camera_id, frame in frames.items()
+        }
+        return {camera_id: future.result() for camera_id, future in futures.items()}
+
     def get_statistics(self) -> dict[str, Any]:
         """
         Get tracker statistics.
@@ -268,13 +653,14 @@ class RFDETRTracker(VisionTracker):
             iou_threshold: IoU threshold for suppression
 
         Returns:
-            Filtered list of detections
-
-        Note:
-            Currently simplified implementation - could be enhanced
+            Filtered list of detections, ordered by decreasing confidence
         """
-        # Simplified NMS for brevity
-        return detections
+        boxes = torch.tensor([detection.bbox for detection in detections], dtype=torch.float32)
+        boxes[:, 2:] += boxes[:, :2]  # (x, y, w, h) -> (x1, y1, x2, y2)
+        scores = torch.tensor([detection.confidence for detection in detections], dtype=torch.float32)
+
+        keep = nms(boxes, scores, iou_threshold)
+        return [detections[i] for i in keep.tolist()]
 
     def transform_to_bev(self, tracks: list[Track]) -> list[BEVTrack]:
         """
@@ -289,58 +675,60 @@ class RFDETRTracker(VisionTracker):
         Returns:
             List of tracks transformed to BEV coordinates
         """
-        bev_tracks = []
-
-        # Debug logging for multi-camera BEV transformation
-        camera_track_counts: dict[int, int] = {}
-        for track in tracks:
-            camera_track_counts[track.camera_id] = camera_track_counts.get(track.camera_id, 0) + 1
-
-        if camera_track_counts:
-            logger.info(f"🗺️ BEV Transform input: {camera_track_counts} tracks per camera")
-
+        # Group feet positions by camera
+        camera_feet: dict[int, list[tuple[int, int]]] = defaultdict(list)
+        camera_tracks: dict[int, list[Track]] = defaultdict(list)
         for track in tracks:
             # Use bottom center of bounding box (feet position)
             x, y, w, h = track.bbox
-            feet_x = x + w // 2
-            feet_y = y + h
+            camera_feet[track.camera_id].append((x + w // 2, y + h))
+            camera_tracks[track.camera_id].append(track)
+
+        if camera_feet and logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "🗺️ BEV Transform input: %s tracks per camera",
+                {camera_id: len(feet) for camera_id, feet in camera_feet.items()},
+            )
 
-            # Transform to BEV coordinates using calibration
-            transformed_points = self.calibration.transform_points_to_bev([(feet_x, feet_y)], track.camera_id)
+        transform_points_to_bev = self.calibration.transform_points_to_bev
+        bev_tracks = []
+        out_of_bounds: dict[int, int] = {}
+        for camera_id, feet_points in camera_feet.items():
+            # Transform all feet positions of this camera with one homography call
+            transformed_points = transform_points_to_bev(feet_points, camera_id)
 
             if not transformed_points:
-                logger.warning(
-                    f"❌ Camera {track.camera_id} track {track.track_id}: No calibration/homography available"
+                logger.debug(
+                    "❌ Camera %s: No calibration/homography available for %d tracks", camera_id, len(feet_points)
                 )
                 continue
 
-            bev_x_pixels, bev_y_pixels = transformed_points[0]
-
             # Validate BEV coordinates are within reasonable bounds (0-600 for typical calibration)
-            if not (0 <= bev_x_pixels <= 600 and 0 <= bev_y_pixels <= 600):
-                logger.warning(
-                    f"⚠️ Camera {track.camera_id} track {track.track_id}: "
-                    f"BEV coords out of bounds: ({bev_x_pixels:.1f},{bev_y_pixels:.1f})"
+            bev_points = np.asarray(transformed_points)
+            in_bounds = ((bev_points >= 0) & (bev_points <= 600)).all(axis=1)
+            if not in_bounds.all():
+                out_of_bounds[camera_id] = int(np.count_nonzero(~in_bounds))
+
+            bev_tracks.extend(
+                BEVTrack(
+                    track_id=track.track_id,
+                    bev_x=bev_x_pixels,
+                    bev_y=bev_y_pixels,
+                    confidence=track.confidence,
+                    camera_id=camera_id,
+                )
+                for track, (bev_x_pixels, bev_y_pixels) in zip(
+                    camera_tracks[camera_id], transformed_points, strict=True
                 )
-
-            logger.debug(
-                f"✅ Camera {track.camera_id} track {track.track_id}: "
-                f"feet({feet_x},{feet_y}) -> BEV({bev_x_pixels:.1f},{bev_y_pixels:.1f})"
             )
 
-            bev_track = BEVTrack(
-                track_id=track.track_id,
-                bev_x=bev_x_pixels,
-                bev_y=bev_y_pixels,
-                confidence=track.confidence,
-                camera_id=track.camera_id,
-            )
-            bev_tracks.append(bev_track)
+        if out_of_bounds:
+            logger.warning("⚠️ BEV coords out of bounds: %s tracks per camera", out_of_bounds)
 
         if bev_tracks:
-            logger.info(f"✅ BEV Transform output: {len(bev_tracks)} BEV tracks created")
-        else:
-            logger.warning("⚠️ BEV Transform: No tracks transformed (check calibration)")
+            logger.debug("✅ BEV Transform output: %d BEV tracks created", len(bev_tracks))
+        elif tracks:
+            logger.debug("⚠️ BEV Transform: No tracks transformed (check calibration)")
 
         return bev_tracks
 
@@ -362,17 +750,14 @@ class RFDETRTracker(VisionTracker):
             return None
 
         try:
-            # Extract bounding boxes from tracks
-            bboxes = []
-            for track in tracks:
-                x, y, w, h = track.bbox
-                # Convert to x1, y1, x2, y2 format expected by ReID extractor
-                bboxes.append([x, y, x + w, y + h])
+            # Convert to x1, y1, x2, y2 format expected by ReID extractor
+            bboxes_array = np.array([track.bbox for track in tracks], dtype=np.float32)
+            bboxes_array[:, 2:] += bboxes_array[:, :2]
 
-            bboxes_array = np.array(bboxes, dtype=np.float32)
-
-            # Extract features using ReID model
-            features = self.reid_extractor.extract_features(frame, bboxes_array)
+            # Extract features using ReID model, from the device copy of the frame if detect() made one
+            features = self.reid_extractor.extract_features(
+                self._device_frame(frame, tracks[0].camera_id), bboxes_array
+            )
 
             if features is not None:
                 logger.debug(f"🔍 Extracted ReID features for {len(tracks)} tracks: shape {features.shape}")
@@ -385,6 +770,43 @@ class RFDETRTracker(VisionTracker):
             logger.error(f"❌ Error extracting ReID features: {e}")
             return None
 
+    def get_reid_features_multi(
+        self, frames: dict[int, np.ndarray], tracks: dict[int, list[Track]]
+    ) -> dict[int, np.ndarray | None]:
+        """
+        Extract ReID features for the tracks of all cameras with one batched ReID forward pass.
+
+        Args:
+            frames: Frames containing the tracked objects keyed by camera ID
+            tracks: Tracks to extract features for keyed by camera ID
+
+        Returns:
+            Features per camera with one row per track (None for cameras without tracks)
+        """
+        camera_ids = [camera_id for camera_id in frames if tracks.get(camera_id)]
+        features_by_camera: dict[int, np.ndarray | None] = dict.fromkeys(
+            (camera_id for camera_id in frames if camera_id in tracks), None
+        )
+        if not self.reid_extractor or not camera_ids:
+            return features_by_camera
+
+        # Convert to x1, y1, x2, y2 format expected by ReID extractor
+        bboxes_list = []
+        for camera_id in camera_ids:
+            xywh = np.array([track.bbox for track in tracks[camera_id]], dtype=np.float32)
+            xywh[:, 2:] += xywh[:, :2]
+            bboxes_list.append(xywh)
+
+        features_list = self.reid_extractor.extract_features_multi(
+            [self._device_frame(frames[camera_id], camera_id) for camera_id in camera_ids], bboxes_list
+        )
+        if features_list is None:
+            logger.warning(f"⚠️ ReID feature extraction returned None for {len(camera_ids)} cameras")
+            return features_by_camera
+
+        features_by_camera.update(zip(camera_ids, features_list, strict=True))
+        return features_by_camera
+
     def get_config_schema(self) -> dict[str, Any]:
         """
         Get the JSON schema for the tracker's configuration.
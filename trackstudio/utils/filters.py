@@ -14,7 +14,8 @@ class SimpleKalmanFilter:
 
     Attributes:
         state: State vector [x, y, vx, vy]
-        F: State transition matrix
+        F: State transition matrix for dt = 1 (informational only; predict() applies
+            the constant velocity model in closed form for any dt)
         H: Measurement matrix
         Q: Process noise covariance
         R: Measurement noise covariance
@@ -44,7 +45,8 @@ class SimpleKalmanFilter:
                 [0, 1, 0, 1],  # y = y + vy
                 [0, 0, 1, 0],  # vx = vx
                 [0, 0, 0, 1],  # vy = vy
-            ]
+            ],
+            dtype=np.float64,
         )
 
         # Measurement matrix (we only measure position)
@@ -77,15 +79,16 @@ class SimpleKalmanFilter:
         Returns:
             Predicted (x, y) position
         """
-        # Update state transition matrix with time step
-        self.F[0, 2] = dt
-        self.F[1, 3] = dt
+        # Predict state; F only adds dt * velocity to position
+        self.state[0] += dt * self.state[2]
+        self.state[1] += dt * self.state[3]
 
-        # Predict state
-        self.state = self.F @ self.state
-
-        # Predict covariance
-        self.P = self.F @ self.P @ self.F.T + self.Q
+        # Predict covariance: F @ P @ F.T expands to adding dt * velocity rows, then columns;
+        # the column step must run on the already updated rows, not on a copy of the old P
+        cov = self.P
+        cov[:2, :] += dt * cov[2:, :]
+        cov[:, :2] += dt * cov[:, 2:]
+        cov += self.Q
 
         return float(self.state[0]), float(self.state[1])
 
@@ -99,23 +102,25 @@ class SimpleKalmanFilter:
         Returns:
             Updated (x, y) position
         """
-        z = np.array(measurement)
+        # H selects the position, so H @ x and H @ P reduce to slices
+        cov = self.P
 
         # Innovation (measurement residual)
-        y = z - self.H @ self.state
+        y = np.array((measurement[0] - self.state[0], measurement[1] - self.state[1]))
 
         # Innovation covariance
-        self.S = self.H @ self.P @ self.H.T + self.R
+        self.S = cov[:2, :2] + self.R
 
-        # Kalman gain
-        self.K = self.P @ self.H.T @ np.linalg.inv(self.S)
+        # Kalman gain, with the 2x2 innovation covariance inverted in closed form
+        (s00, s01), (s10, s11) = self.S.tolist()
+        inv_det = 1.0 / (s00 * s11 - s01 * s10)
+        self.K = cov[:, :2] @ np.array(((s11 * inv_det, -s01 * inv_det), (-s10 * inv_det, s00 * inv_det)))
 
         # Update state
-        self.state = self.state + self.K @ y
+        self.state += self.K @ y
 
-        # Update covariance
-        identity = np.eye(4)
-        self.P = (identity - self.K @ self.H) @ self.P
+        # Update covariance: (I - K @ H) @ P == P - K @ (H @ P)
+        self.P = cov - self.K @ cov[:2, :]
 
         return float(self.state[0]), float(self.state[1])
 
@@ -147,6 +152,120 @@ class SimpleKalmanFilter:
         return self.state.copy()
 
 
+class BatchedKalmanFilter:
+    """
+    Constant velocity Kalman filter for many tracks at once.
+
+    Uses the same model as SimpleKalmanFilter, but keeps the state of all tracks
+    in stacked arrays so predict and update run as a few NumPy operations over
+    every track instead of one filter call per track.
+
+    Attributes:
+        state: (T, 4) state vectors [x, y, vx, vy], one row per track
+        P: (T, 4, 4) state covariance matrices
+        Q: Process noise covariance
+        R: Measurement noise covariance
+    """
+
+    def __init__(self, process_noise: float = 1.0, measurement_noise: float = 10.0) -> None:
+        """
+        Initialize an empty batch of Kalman filters.
+
+        Args:
+            process_noise: Process noise (higher = less trust in model)
+            measurement_noise: Measurement noise (higher = less trust in measurements)
+        """
+        self.state = np.empty((0, 4))
+        self.P = np.empty((0, 4, 4))
+
+        # Process noise covariance
+        self.Q = np.eye(4) * process_noise
+        self.Q[2, 2] = process_noise * 0.1  # Less noise for velocity
+        self.Q[3, 3] = process_noise * 0.1
+
+        # Measurement noise covariance
+        self.R = np.eye(2) * measurement_noise
+
+    def __len__(self) -> int:
+        """Number of tracks in the batch."""
+        return len(self.state)
+
+    def add(self, initial_pos: tuple[float, float]) -> int:
+        """
+        Add a track to the batch.
+
+        Args:
+            initial_pos: Initial (x, y) position
+
+        Returns:
+            Row index of the new track
+        """
+        self.state = np.vstack((self.state, (initial_pos[0], initial_pos[1], 0.0, 0.0)))
+        self.P = np.concatenate((self.P, np.eye(4)[None] * 100))  # Initial uncertainty
+        return len(self.state) - 1
+
+    def remove(self, index: int) -> None:
+        """
+        Remove a track from the batch.
+
+        Rows after the removed one shift down by one.
+
+        Args:
+            index: Row index of the track to remove
+        """
+        self.state = np.delete(self.state, index, axis=0)
+        self.P = np.delete(self.P, index, axis=0)
+
+    def predict(self, dt: float = 1.0) -> np.ndarray:
+        """
+        Predict the next state of every track.
+
+        Args:
+            dt: Time step
+
+        Returns:
+            (T, 2) predicted positions
+        """
+        # Constant velocity: position += dt * velocity
+        self.state[:, :2] += dt * self.state[:, 2:]
+
+        # F @ P @ F.T for every track, expanded into row and column updates
+        self.P[:, :2, :] += dt * self.P[:, 2:, :]
+        self.P[:, :, :2] += dt * self.P[:, :, 2:]
+        self.P += self.Q
+
+        return self.state[:, :2].copy()
+
+    def update(self, measurements: np.ndarray, mask: np.ndarray | None = None) -> np.ndarray:
+        """
+        Update tracks with new position measurements.
+
+        Args:
+            measurements: (T, 2) measured positions, one row per track
+            mask: Optional (T,) boolean array selecting the tracks that were measured
+
+        Returns:
+            (T, 2) updated positions
+        """
+        rows = np.arange(len(self.state)) if mask is None else np.flatnonzero(mask)
+        if len(rows) == 0:
+            return self.state[:, :2].copy()
+
+        cov = self.P[rows]
+
+        # Innovation and its covariance (H selects the position)
+        y = np.asarray(measurements, dtype=np.float64)[rows] - self.state[rows, :2]
+        innovation_cov = cov[:, :2, :2] + self.R
+
+        # Kalman gain for every measured track
+        gain = cov[:, :, :2] @ np.linalg.inv(innovation_cov)
+
+        self.state[rows] += np.einsum("nij,nj->ni", gain, y)
+        self.P[rows] = cov - gain @ cov[:, :2, :]
+
+        return self.state[:, :2].copy()
+
+
 class TrackSmoother:
     """
     Simple exponential moving average smoother for tracks.
@@ -167,7 +286,7 @@ class TrackSmoother:
             alpha: Smoothing factor (0-1, higher = more weight on recent)
         """
         self.alpha = alpha
-        self.smooth_pos: np.ndarray | None = None
+        self.smooth_pos: tuple[float, float] | None = None
 
     def update(self, position: tuple[float, float]) -> tuple[float, float]:
         """
@@ -180,11 +299,16 @@ class TrackSmoother:
             Smoothed position
         """
         if self.smooth_pos is None:
-            self.smooth_pos = np.array(position, dtype=np.float64)
+            self.smooth_pos = (float(position[0]), float(position[1]))
         else:
-            self.smooth_pos = self.alpha * np.array(position, dtype=np.float64) + (1 - self.alpha) * self.smooth_pos
-
-        return float(self.smooth_pos[0]), float(self.smooth_pos[1])
+            alpha = self.alpha
+            smooth_x, smooth_y = self.smooth_pos
+            self.smooth_pos = (
+                alpha * position[0] + (1 - alpha) * smooth_x,
+                alpha * position[1] + (1 - alpha) * smooth_y,
+            )
+
+        return self.smooth_pos
 
     def reset(self) -> None:
         """
@@ -5,13 +5,34 @@ This module defines configuration classes for the vision tracking system,
 including tracker and merger configurations with proper type annotations.
 """
 
+import logging
+from functools import cache, lru_cache
 from typing import Any, Literal
 
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 
-from trackstudio.config_registry import register_merger_config, register_tracker_config
+from trackstudio.config_registry import (
+    get_merger_names,
+    get_registered_merger_configs,
+    get_registered_tracker_configs,
+    get_tracker_names,
+    register_merger_config,
+    register_tracker_config,
+)
 from trackstudio.trackers.base import BaseTrackerConfig
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None, typed=True)
+def _slider_schema_extra(min_val: float, max_val: float, step: float, value_type: str) -> dict[str, Any]:
+    """
+    Build the UI slider metadata for a field, shared by all fields with the same range.
+
+    The returned dict is shared between fields, so it must not be mutated.
+    """
+    return {"ui_control": "slider", "min": min_val, "max": max_val, "step": step, "type": value_type}
+
 
 def slider_field(default: float, min_val: float, max_val: float, step: float, title: str, description: str) -> float:
     """
@@ -32,7 +53,7 @@ def slider_field(default: float, min_val: float, max_val: float, step: float, ti
         default=default,
         title=title,
         description=description,
-        json_schema_extra={"ui_control": "slider", "min": min_val, "max": max_val, "step": step, "type": "float"},
+        json_schema_extra=_slider_schema_extra(min_val, max_val, step, "float"),
     )
 
 
@@ -55,7 +76,7 @@ def int_slider_field(default: int, min_val: int, max_val: int, step: int, title:
         default=default,
         title=title,
         description=description,
-        json_schema_extra={"ui_control": "slider", "min": min_val, "max": max_val, "step": step, "type": "integer"},
+        json_schema_extra=_slider_schema_extra(min_val, max_val, step, "integer"),
     )
 
 
@@ -149,6 +170,7 @@ class CrossCameraConfig(BaseModel):
         appearance_weight: Weight of appearance vs spatial distance in matching
         smoothing_alpha: Alpha for exponential smoothing of position
         velocity_alpha: Alpha for smoothing velocity estimation
+        max_history_frames: Maximum number of positions kept per global track
     """
 
     spatial_threshold: float = slider_field(
@@ -174,177 +196,189 @@ class CrossCameraConfig(BaseModel):
     velocity_alpha: float = slider_field(
         0.5, 0.0, 1.0, 0.05, "Velocity Smoothing", "Alpha for smoothing velocity. Lower is more smooth."
     )
+    max_history_frames: int = int_slider_field(
+        300, 30, 3000, 30, "Max History Frames", "Number of recent positions kept per global track."
+    )
 
 
-# Create the dynamic configuration system
-def _create_config_system() -> tuple[type[BaseModel], str, str]:
-    """
-    Create the dynamic config system with auto-registration.
+def _registered_tracker_config(tracker_type: str) -> BaseTrackerConfig | None:
+    """Default config of a tracker type from the config registry, or None if it isn't registered"""
+    config_class = get_registered_tracker_configs().get(tracker_type)
+    return config_class() if config_class is not None else None
 
-    This function creates a dynamic VisionSystemConfig class that includes
-    all registered tracker and merger types in its schema.
 
-    Returns:
-        Tuple of (VisionSystemConfig class, TrackerType, MergerType)
-    """
-    from trackstudio.config_registry import get_config_classes  # noqa: PLC0415
+def _registered_merger_config(merger_type: str) -> BaseModel | None:
+    """Default config of a merger type from the config registry, or None if it isn't registered"""
+    config_class = get_registered_merger_configs().get(merger_type)
+    return config_class() if config_class is not None else None
 
-    try:
-        VisionSystemConfig, TrackerType, MergerType = get_config_classes()  # noqa: N806
-        return VisionSystemConfig, TrackerType, MergerType
-    except Exception as e:
-        # If dynamic config creation fails, fall back to basic config
-        import logging  # noqa: PLC0415
 
-        logger = logging.getLogger(__name__)
-        logger.warning(f"⚠️ Failed to get dynamic config classes, using fallback: {e}")
+class BasicVisionSystemConfig(BaseModel):
+    """Fallback config when dynamic system is not available"""
 
-        # Use simplified fallback config - create a basic class
-        from pydantic import BaseModel  # noqa: PLC0415
+    tracker_type: str = "dummy"  # Safe default tracker
+    merger_type: str = "bev_cluster"  # Safe default merger
 
-        class BasicVisionSystemConfig(BaseModel):
-            """Fallback config when dynamic system is not available"""
+    def get_tracker_config(self) -> BaseTrackerConfig:
+        # Try to get from registry first
+        registered_config = _registered_tracker_config(self.tracker_type)
+        if registered_config is not None:
+            return registered_config
 
-            tracker_type: str = "dummy"  # Safe default tracker
-            merger_type: str = "bev_cluster"  # Safe default merger
+        # Fall back to base config if not found
+        logger.warning(f"⚠️ Tracker config not found for {self.tracker_type}, using base config")
+        return BaseTrackerConfig()
 
-            def get_tracker_config(self) -> BaseTrackerConfig:
-                # Try to get from registry first
-                from trackstudio.config_registry import get_registered_tracker_configs  # noqa: PLC0415
+    def get_merger_config(self) -> BaseModel:
+        # Try to get from registry first
+        registered_config = _registered_merger_config(self.merger_type)
+        if registered_config is not None:
+            return registered_config
 
-                configs = get_registered_tracker_configs()
-                if self.tracker_type in configs:
-                    return configs[self.tracker_type]()
+        # Fall back to empty config
+        logger.warning(f"⚠️ Merger config not found for {self.merger_type}, using empty config")
+        return BaseModel()
 
-                # Fall back to base config if not found
-                logger.warning(f"⚠️ Tracker config not found for {self.tracker_type}, using base config")
-                return BaseTrackerConfig()
+    def get_available_trackers(self) -> list[str]:
+        registered = get_tracker_names()
+        return registered if registered else ["dummy"]
 
-            def get_merger_config(self) -> BaseModel:
-                # Try to get from registry first
-                from trackstudio.config_registry import get_registered_merger_configs  # noqa: PLC0415
+    def get_available_mergers(self) -> list[str]:
+        registered = get_merger_names()
+        return registered if registered else ["bev_cluster"]
 
-                configs = get_registered_merger_configs()
-                if self.merger_type in configs:
-                    return configs[self.merger_type]()
 
-                # Fall back to empty config
-                logger.warning(f"⚠️ Merger config not found for {self.merger_type}, using empty config")
-                return BaseModel()
+# Built-in configs used by the static fallback when a type is not in the registry
+_FALLBACK_TRACKER_CONFIGS: dict[str, type[BaseTrackerConfig]] = {
+    "rfdetr": RFDETRTrackerConfig,
+    "dummy": DummyTrackerConfig,
+}
+_FALLBACK_MERGER_CONFIGS: dict[str, type[BaseModel]] = {"bev_cluster": CrossCameraConfig}
 
-            def get_available_trackers(self) -> list[str]:
-                from trackstudio.config_registry import get_tracker_names  # noqa: PLC0415
 
-                registered = get_tracker_names()
-                return registered if registered else ["dummy"]
+@lru_cache(maxsize=1)
+def _fallback_tracker_names() -> list[str]:
+    """
+    Registered and built-in tracker types, sorted.
 
-            def get_available_mergers(self) -> list[str]:
-                from trackstudio.config_registry import get_merger_names  # noqa: PLC0415
+    Cached until the config system is refreshed, so callers must treat it as read-only.
+    """
+    return sorted({*get_tracker_names(), *_FALLBACK_TRACKER_CONFIGS})
 
-                registered = get_merger_names()
-                return registered if registered else ["bev_cluster"]
 
-        return BasicVisionSystemConfig, str, str
+@lru_cache(maxsize=1)
+def _fallback_merger_names() -> list[str]:
+    """
+    Registered and built-in merger types, sorted.
 
+    Cached until the config system is refreshed, so callers must treat it as read-only.
+    """
+    return sorted({*get_merger_names(), *_FALLBACK_MERGER_CONFIGS})
 
-# Dynamic configuration system - will be created when needed
-_VisionSystemConfig: type[BaseModel] | None = None
-_TrackerType: str | None = None
-_MergerType: str | None = None
 
+# Fallback static config that accepts any tracker type
+class _VisionSystemConfigFallback(BaseModel):
+    """Fallback static configuration for the vision system"""
 
-def get_vision_system_config(force_refresh: bool = False) -> type[BaseModel]:
-    """
-    Get or create the dynamic VisionSystemConfig class.
+    # Any tracker/merger type is accepted here - validation happens in the factory
+    tracker_type: str = Field(default="rfdetr", title="Tracker Type")
+    merger_type: str = Field(default="bev_cluster", title="Merger Type")
 
-    Args:
-        force_refresh: Whether to force recreation of the config class
+    def get_tracker_config(self) -> BaseTrackerConfig:
+        # Try to get from registry first
+        registered_config = _registered_tracker_config(self.tracker_type)
+        if registered_config is not None:
+            return registered_config
 
-    Returns:
-        The dynamic VisionSystemConfig class
-    """
-    global _VisionSystemConfig, _TrackerType, _MergerType  # noqa: PLW0603
+        # Fallback to hardcoded configs
+        config_class = _FALLBACK_TRACKER_CONFIGS.get(self.tracker_type)
+        if config_class is None:
+            raise ValueError(f"Unknown tracker type: {self.tracker_type}")
+        return config_class()
 
-    if _VisionSystemConfig is None or force_refresh:
-        try:
-            _VisionSystemConfig, _TrackerType, _MergerType = _create_config_system()
-        except Exception as e:
-            # Fallback to basic types if dynamic creation fails
-            import logging  # noqa: PLC0415
+    def get_merger_config(self) -> BaseModel:
+        # Try to get from registry first
+        registered_config = _registered_merger_config(self.merger_type)
+        if registered_config is not None:
+            return registered_config
 
-            logger = logging.getLogger(__name__)
-            logger.warning(f"⚠️ Could not create dynamic config system: {e}, using fallback")
+        # Fallback to hardcoded configs
+        config_class = _FALLBACK_MERGER_CONFIGS.get(self.merger_type)
+        if config_class is None:
+            raise ValueError(f"Unknown merger type: {self.merger_type}")
+        return config_class()
 
-            # Fallback static config that accepts any tracker type
-            class _VisionSystemConfigFallback(BaseModel):
-                """Fallback static configuration for the vision system"""
+    def get_available_trackers(self) -> list[str]:
+        return _fallback_tracker_names()
 
-                tracker_type: str = Field(default="rfdetr", title="Tracker Type")
-                merger_type: str = Field(default="bev_cluster", title="Merger Type")
+    def get_available_mergers(self) -> list[str]:
+        return _fallback_merger_names()
 
-                @validator("tracker_type")
-                def validate_tracker_type(self, v: str) -> str:
-                    # Accept any tracker type - validation will happen in the factory
-                    return v
 
-                @validator("merger_type")
-                def validate_merger_type(self, v: str) -> str:
-                    # Accept any merger type - validation will happen in the factory
-                    return v
+# Create the dynamic configuration system
+def _create_config_system() -> tuple[type[BaseModel], str, str]:
+    """
+    Create the dynamic config system with auto-registration.
 
-                def get_tracker_config(self) -> BaseTrackerConfig:
-                    # Try to get from registry first
-                    from trackstudio.config_registry import get_registered_tracker_configs  # noqa: PLC0415
+    This function creates a dynamic VisionSystemConfig class that includes
+    all registered tracker and merger types in its schema.
 
-                    configs = get_registered_tracker_configs()
-                    if self.tracker_type in configs:
-                        return configs[self.tracker_type]()
+    Returns:
+        Tuple of (VisionSystemConfig class, TrackerType, MergerType)
+    """
+    from trackstudio.config_registry import get_config_classes  # noqa: PLC0415
 
-                    # Fallback to hardcoded configs
-                    if self.tracker_type == "rfdetr":
-                        return RFDETRTrackerConfig()
-                    if self.tracker_type == "dummy":
-                        return DummyTrackerConfig()
-                    raise ValueError(f"Unknown tracker type: {self.tracker_type}")
+    try:
+        VisionSystemConfig, TrackerType, MergerType = get_config_classes()  # noqa: N806
+        return VisionSystemConfig, TrackerType, MergerType
+    except Exception as e:
+        # If dynamic config creation fails, fall back to basic config
+        logger.warning(f"⚠️ Failed to get dynamic config classes, using fallback: {e}")
+        return BasicVisionSystemConfig, str, str
 
-                def get_merger_config(self) -> BaseModel:
-                    # Try to get from registry first
-                    from trackstudio.config_registry import get_registered_merger_configs  # noqa: PLC0415
 
-                    configs = get_registered_merger_configs()
-                    if self.merger_type in configs:
-                        return configs[self.merger_type]()
+# JSON schemas of the dynamic config classes, keyed by id() of the class; cleared on refresh
+_SCHEMA_CACHE: dict[int, dict[str, Any]] = {}
 
-                    # Fallback to hardcoded configs
-                    if self.merger_type == "bev_cluster":
-                        return CrossCameraConfig()
-                    raise ValueError(f"Unknown merger type: {self.merger_type}")
 
-                def get_available_trackers(self) -> list[str]:
-                    from trackstudio.config_registry import get_tracker_names  # noqa: PLC0415
+@cache
+def _resolve_config_system() -> tuple[type[BaseModel], str | None, str | None]:
+    """
+    Create the dynamic config system once, until refresh_config_system() is called.
 
-                    registered = get_tracker_names()
-                    fallback = ["rfdetr", "dummy"]
-                    return list(set(registered + fallback))
+    Returns:
+        Tuple of (VisionSystemConfig class, TrackerType, MergerType); the types are None
+        when the static fallback class is used
+    """
+    try:
+        return _create_config_system()
+    except Exception as e:
+        # Fallback to basic types if dynamic creation fails
+        logger.warning(f"⚠️ Could not create dynamic config system: {e}, using fallback")
+        return _VisionSystemConfigFallback, None, None
 
-                def get_available_mergers(self) -> list[str]:
-                    from trackstudio.config_registry import get_merger_names  # noqa: PLC0415
 
-                    registered = get_merger_names()
-                    fallback = ["bev_cluster"]
-                    return list(set(registered + fallback))
+def get_vision_system_config(force_refresh: bool = False) -> type[BaseModel]:
+    """
+    Get or create the dynamic VisionSystemConfig class.
 
-            _VisionSystemConfig = _VisionSystemConfigFallback
+    Args:
+        force_refresh: Whether to force recreation of the config class
 
-    return _VisionSystemConfig
+    Returns:
+        The dynamic VisionSystemConfig class
+    """
+    if force_refresh:
+        refresh_config_system()
+    return _resolve_config_system()[0]
 
 
 def refresh_config_system() -> None:
     """Force refresh of the config system to pick up newly registered trackers"""
-    global _VisionSystemConfig, _TrackerType, _MergerType  # noqa: PLW0603
-    _VisionSystemConfig = None
-    _TrackerType = None
-    _MergerType = None
+    _resolve_config_system.cache_clear()
+    _fallback_tracker_names.cache_clear()
+    _fallback_merger_names.cache_clear()
+    _SCHEMA_CACHE.clear()
 
 
 # Create a proxy that calls get_vision_system_config when needed
@@ -367,19 +401,25 @@ class VisionSystemConfigMeta(type):
         Returns:
             Instance of the dynamic VisionSystemConfig
         """
-        # Only refresh if needed, not on every call
-        config_class = get_vision_system_config(force_refresh=False)
-        return config_class(*args, **kwargs)
+        # Read the cached class directly; the proxy stays in place so refreshes are picked up
+        return _resolve_config_system()[0](*args, **kwargs)
 
     def model_json_schema(cls) -> dict[str, Any]:
         """
         Get the JSON schema for the dynamic config class.
 
+        The schema is generated once per config class and cached until the config
+        system is refreshed, so callers must treat it as read-only.
+
         Returns:
             JSON schema dictionary for the UI
         """
-        config_class = get_vision_system_config(force_refresh=False)
-        return config_class.model_json_schema()
+        config_class = _resolve_config_system()[0]
+        schema = _SCHEMA_CACHE.get(id(config_class))
+        if schema is None:
+            schema = config_class.model_json_schema()
+            _SCHEMA_CACHE[id(config_class)] = schema
+        return schema
 
     def model_dump_json(cls, *args: Any, **kwargs: Any) -> str:
         """
@@ -392,7 +432,7 @@ class VisionSystemConfigMeta(type):
         Returns:
             JSON string representation
         """
-        config_class = get_vision_system_config(force_refresh=False)
+        config_class = _resolve_config_system()[0]
         return config_class.model_dump_json(*args, **kwargs)
 
 
@@ -416,9 +456,7 @@ def get_tracker_type() -> str:
     Returns:
         The current tracker type string
     """
-    if _TrackerType is None:
-        get_vision_system_config()  # This will initialize _TrackerType
-    return _TrackerType or "str"
+    return _resolve_config_system()[1] or "str"
 
 
 # Unused functions - removed for optimization
@@ -7,19 +7,26 @@ of the entire vision processing pipeline.
 """
 
 import logging
+from functools import lru_cache
+from itertools import product
+from typing import TYPE_CHECKING
 
-from trackstudio.merger_factory import create_merger, get_available_mergers, get_merger_type_from_env
-from trackstudio.mergers.base import VisionMerger
-from trackstudio.tracker_factory import create_tracker, get_available_trackers, get_tracker_type_from_env
-from trackstudio.trackers.base import VisionTracker
-from trackstudio.vision_config import VisionSystemConfig
+# The factories, registries and config system are imported where they are used, so importing
+# this module for validation or listing does not pull in every component
+if TYPE_CHECKING:
+    from trackstudio.mergers.base import VisionMerger
+    from trackstudio.trackers.base import VisionTracker
+    from trackstudio.vision_config import VisionSystemConfig
 
 logger = logging.getLogger(__name__)
 
+# Sentinel for component attributes that are not defined at all
+_MISSING = object()
+
 
 def create_vision_system(
     tracker_type: str | None = None, merger_type: str | None = None, calibration_file: str | None = None
-) -> tuple[VisionTracker, VisionMerger, VisionSystemConfig]:
+) -> tuple["VisionTracker", "VisionMerger", "VisionSystemConfig"]:
     """
     Create a complete vision system with tracker and merger components.
 
@@ -48,6 +55,18 @@ def create_vision_system(
         >>> tracker, merger, config = create_vision_system("rfdetr", "bev_cluster")
         >>> # Use tracker and merger for vision processing
     """
+    from trackstudio.merger_factory import (  # noqa: PLC0415
+        create_merger,
+        get_available_mergers,
+        get_merger_type_from_env,
+    )
+    from trackstudio.tracker_factory import (  # noqa: PLC0415
+        create_tracker,
+        get_available_trackers,
+        get_tracker_type_from_env,
+    )
+    from trackstudio.vision_config import VisionSystemConfig, get_vision_system_config  # noqa: PLC0415
+
     # Determine tracker type with fallback logic
     if tracker_type is None:
         tracker_type = get_tracker_type_from_env()
@@ -78,9 +97,11 @@ def create_vision_system(
             merger_type = "bev_cluster"
             logger.warning("🔄 No mergers available, using default bev_cluster")
 
-    # Create configuration with validated component types
+    # Create configuration with validated component types; both were checked against the
+    # registries above, so the dynamic config class is built without re-validating them
     try:
-        config = VisionSystemConfig(tracker_type=tracker_type, merger_type=merger_type)  # type: ignore
+        config_class = get_vision_system_config(force_refresh=False)
+        config = config_class.model_construct(tracker_type=tracker_type, merger_type=merger_type)
         logger.debug(f"✅ Created vision system config: {tracker_type} + {merger_type}")
     except Exception as e:
         logger.error(f"❌ Failed to create config with tracker_type={tracker_type}, merger_type={merger_type}: {e}")
@@ -111,7 +132,7 @@ def create_vision_system(
     return tracker, merger, config
 
 
-def _optimize_shared_resources(tracker: VisionTracker, merger: VisionMerger) -> None:
+def _optimize_shared_resources(tracker: "VisionTracker", merger: "VisionMerger") -> None:
     """
     Optimize shared resources between tracker and merger components.
 
@@ -126,21 +147,22 @@ def _optimize_shared_resources(tracker: VisionTracker, merger: VisionMerger) ->
     Note:
         This function modifies the components in-place to share resources.
     """
-    # Check if both components have ReID extractors that can be shared
-    if hasattr(tracker, "reid_extractor") and hasattr(merger, "reid_extractor"):
-        tracker_has_reid = getattr(tracker, "reid_extractor", None) is not None
-        merger_has_reid = getattr(merger, "reid_extractor", None) is not None
-
-        if tracker_has_reid and not merger_has_reid:
-            # Share tracker's ReID extractor with merger
-            merger.reid_extractor = tracker.reid_extractor
-            logger.info("♻️ Shared ReID extractor from tracker to merger")
-        elif merger_has_reid and not tracker_has_reid:
-            # Share merger's ReID extractor with tracker
-            tracker.reid_extractor = merger.reid_extractor
-            logger.info("♻️ Shared ReID extractor from merger to tracker")
-        elif tracker_has_reid and merger_has_reid:
-            logger.debug("ℹ️ Both components have ReID extractors - no sharing needed")
+    # Only components that both support a ReID extractor can share one
+    tracker_reid = getattr(tracker, "reid_extractor", _MISSING)
+    merger_reid = getattr(merger, "reid_extractor", _MISSING)
+    if tracker_reid is _MISSING or merger_reid is _MISSING:
+        return
+
+    if tracker_reid is not None and merger_reid is None:
+        # Share tracker's ReID extractor with merger
+        merger.reid_extractor = tracker_reid
+        logger.info("♻️ Shared ReID extractor from tracker to merger")
+    elif merger_reid is not None and tracker_reid is None:
+        # Share merger's ReID extractor with tracker
+        tracker.reid_extractor = merger_reid
+        logger.info("♻️ Shared ReID extractor from merger to tracker")
+    elif tracker_reid is not None and merger_reid is not None:
+        logger.debug("ℹ️ Both components have ReID extractors - no sharing needed")
 
 
 def get_available_vision_systems() -> list[tuple[str, str]]:
@@ -158,16 +180,21 @@ def get_available_vision_systems() -> list[tuple[str, str]]:
         >>> print(combinations)
         [('rfdetr', 'bev_cluster'), ('dummy', 'bev_cluster'), ...]
     """
-    trackers = get_available_trackers()
-    mergers = get_available_mergers()
+    from trackstudio.merger_factory import get_available_mergers  # noqa: PLC0415
+    from trackstudio.tracker_factory import get_available_trackers  # noqa: PLC0415
 
-    combinations = []
-    combinations.extend((tracker_type, merger_type) for tracker_type in trackers for merger_type in mergers)
+    combinations = list(_compute_vision_systems(tuple(get_available_trackers()), tuple(get_available_mergers())))
 
     logger.debug(f"📋 Available vision system combinations: {len(combinations)}")
     return combinations
 
 
+@lru_cache(maxsize=1)
+def _compute_vision_systems(trackers: tuple[str, ...], mergers: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    """Cartesian product of tracker and merger types, cached until either list changes"""
+    return tuple(product(trackers, mergers))
+
+
 def validate_vision_system_config(tracker_type: str, merger_type: str) -> bool:
     """
     Validate that a specific tracker and merger combination is supported.
@@ -187,6 +214,9 @@ def validate_vision_system_config(tracker_type: str, merger_type: str) -> bool:
         >>> if is_valid:
         ...     tracker, merger, config = create_vision_system("rfdetr", "bev_cluster")
     """
+    from trackstudio.merger_factory import get_available_mergers  # noqa: PLC0415
+    from trackstudio.tracker_factory import get_available_trackers  # noqa: PLC0415
+
     available_trackers = get_available_trackers()
     available_mergers = get_available_mergers()
 
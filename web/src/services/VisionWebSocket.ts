@@ -68,6 +68,9 @@ export class VisionWebSocketService {
   private readonly MAX_RECONNECT_ATTEMPTS = 10
   private reconnectAttempts = 0
 
+  // Metadata arrives as UTF-8 encoded JSON in binary frames
+  private readonly decoder = new TextDecoder()
+
   constructor() {
     // Vision WebSocket service initialized
   }
@@ -89,6 +92,7 @@ export class VisionWebSocketService {
       const url = `${protocol}//${host}/ws/vision-metadata`
 
       this.websocket = new WebSocket(url)
+      this.websocket.binaryType = 'arraybuffer'
 
       this.websocket.onopen = () => {
         this.isConnecting = false
@@ -98,7 +102,8 @@ export class VisionWebSocketService {
 
       this.websocket.onmessage = (event) => {
         try {
-          const data = JSON.parse(event.data) as VisionMessage
+          const text = typeof event.data === 'string' ? event.data : this.decoder.decode(event.data)
+          const data = JSON.parse(text) as VisionMessage
           this.onMessage?.(data)
         } catch (error) {
           console.error('Error parsing vision metadata:', error)